@@ -115,8 +115,13 @@ def main():
 
     _ALLOWED_KEYS = _allowed_keys_set()
 
+    # Upper bound on how long an idle scene sleeps waiting for input; keeps
+    # slow timers (e.g. hover peek delays) responsive.
+    IDLE_WAIT_MS = 100
+
     running = True
     confirm_quit = False
+    quit_overlay_shown = False
 
     def _confirm_modal_rects():
         mw, mh = 460, 180
@@ -133,8 +138,17 @@ def main():
         no.bottom  = modal.bottom - 20
         return modal, yes, no
     while running:
+        # One draw and at most one flip per iteration, capped at 60 fps
         dt = clock.tick(60) / 1000.0
-        for e in pygame.event.get():
+        if confirm_quit or scene.wants_realtime():
+            events = pygame.event.get()
+        else:
+            # Nothing animating: block in SDL until input arrives instead of polling
+            first = pygame.event.wait(IDLE_WAIT_MS)
+            events = ([first] if first.type != pygame.NOEVENT else []) + pygame.event.get()
+        # Events that pass the filters below, delivered to the scene in one batch
+        scene_events = []
+        for e in events:
             if e.type == pygame.QUIT:
                 helper = getattr(scene, "ui_helper", None)
                 modal = getattr(helper, "menu_modal", None)
@@ -150,6 +164,8 @@ def main():
                 # Apply new size and relayout UI
                 C.SCREEN_W, C.SCREEN_H = e.size
                 screen = pygame.display.set_mode((C.SCREEN_W, C.SCREEN_H), pygame.RESIZABLE)
+                if hasattr(scene, "mark_dirty"):
+                    scene.mark_dirty()
                 # Relayout any scene that supports it
                 if hasattr(scene, "compute_layout"):
                     try:
@@ -198,9 +214,16 @@ def main():
                 # Enforce key allowlist (except Alt+F4 path handled above)
                 if e.type == pygame.KEYDOWN and getattr(e, "key", None) not in _ALLOWED_KEYS:
                     continue
-                scene.handle_event(e)
+                scene_events.append(e)
+        if scene_events:
+            scene.handle_events(scene_events)
         if scene.next_scene is not None:
             scene = scene.next_scene
+        if (confirm_quit or quit_overlay_shown) and hasattr(scene, "mark_dirty"):
+            # The quit overlay is translucent; repaint the scene beneath it every
+            # frame, and once more after it closes to erase it
+            scene.mark_dirty()
+        quit_overlay_shown = confirm_quit
         scene.draw(screen)
         # Overlay quit confirmation if active
         if confirm_quit:
@@ -224,7 +247,9 @@ def main():
                 screen.blit(t, (rect.centerx - t.get_width() // 2, rect.centery - t.get_height() // 2))
             draw_btn(yes_r, "Yes")
             draw_btn(no_r, "No")
-        pygame.display.flip()
+        # Nothing new to present when the scene reused its previous frame
+        if confirm_quit or not getattr(scene, "idle_frame", False):
+            pygame.display.flip()
     pygame.quit()
 
 if __name__ == "__main__":
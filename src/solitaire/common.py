@@ -241,8 +241,8 @@ def draw_suit_shape(surface, center, suit_index, color, size=42):
         pygame.draw.rect(surface, color, (x - stem_w//2, y + r, stem_w, size//2))
 
 # Cache
-_img_face_cache = {}   # (suit, rank) -> Surface
-_img_back_cache = None
+_img_face_cache = {}   # (suit, rank) -> Surface, or None when no image file exists
+_img_back_cache = None  # Surface once loaded; False when no back image file exists
 
 # Suit index -> name(s) used in filenames; try both to be safe
 _SUITS_PRIMARY  = {0: "Spades",   1: "Hearts",   2: "Diamonds", 3: "Clubs"}
@@ -288,26 +288,38 @@ def _get_image_face_surface(card, size):
     key = (card.suit, card.rank)
     if key in _img_face_cache:
         return _img_face_cache[key]
+    found = False
     for stem in _face_filename_stems(card.suit, card.rank):
         path = _find_file_for_stem(stem)
         if path:
+            found = True
             s = _load_scaled(path, size)
             if s:
                 _img_face_cache[key] = s
                 return s
+    # Remember a missing file so the drawn fallback doesn't re-probe the
+    # filesystem every frame; a file that failed to load is retried
+    if not found:
+        _img_face_cache[key] = None
     return None
 
 def _get_image_back_surface(size):
     global _img_back_cache
+    if _img_back_cache is False:
+        return None
     if _img_back_cache is not None:
         return _img_back_cache
+    found = False
     for stem in _back_filename_stems():
         path = _find_file_for_stem(stem)
         if path:
+            found = True
             s = _load_scaled(path, size)
             if s:
                 _img_back_cache = s
                 return s
+    if not found:
+        _img_back_cache = False
     return None
 
 
@@ -436,12 +448,40 @@ class Button:
     def hovered(self, mouse_pos):
         return self.rect.collidepoint(mouse_pos)
 
+def coalesce_motion(events):
+    # Collapse each run of consecutive MOUSEMOTION events to its last one, for
+    # scenes that only ever read the latest pointer position; order relative
+    # to clicks and keys is kept.
+    if len(events) < 2:
+        return events
+    motion = pygame.MOUSEMOTION
+    last = len(events) - 1
+    return [e for i, e in enumerate(events)
+            if e.type != motion or i == last or events[i + 1].type != motion]
+
 # ---------- Base Scene ----------
 class Scene:
     def __init__(self, app):
         self.app = app
         self.next_scene = None
+        # Scenes that skip idle redraws consult this; the main loop sets it when
+        # the screen contents were invalidated from outside the scene.
+        self._dirty = True
+        # Set by draw() when it left the previous frame untouched, so the main
+        # loop can skip presenting an identical image.
+        self.idle_frame = False
+    def mark_dirty(self):
+        self._dirty = True
+    def wants_realtime(self):
+        # True while the scene animates or tracks time; idle scenes let the
+        # main loop sleep until input arrives.
+        return True
     def handle_event(self, e): pass
+    def handle_events(self, events):
+        # One call per frame with everything the main loop let through;
+        # scenes may override to coalesce or drop events in bulk.
+        for e in events:
+            self.handle_event(e)
     def update(self, dt): pass
     def draw(self, screen): pass
     def draw_top_bar(self, screen, title, extra=""):
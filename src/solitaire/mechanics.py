@@ -307,6 +307,7 @@ class DragPanController:
         self._active: bool = False
         self._anchor: Optional[Tuple[int, int]] = None
         self._scroll_anchor: Optional[Tuple[int, int]] = None
+        self._last_pos: Optional[Tuple[int, int]] = None
 
     def handle_event(
         self,
@@ -325,6 +326,7 @@ class DragPanController:
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == self.button:
             self._active = True
             self._anchor = event.pos
+            self._last_pos = event.pos
             sx = getattr(target, attr_x, 0) if attr_x else 0
             sy = getattr(target, attr_y, 0) if attr_y else 0
             self._scroll_anchor = (int(sx), int(sy))
@@ -335,6 +337,7 @@ class DragPanController:
                 self._active = False
                 self._anchor = None
                 self._scroll_anchor = None
+                self._last_pos = None
                 return True
             return False
 
@@ -344,6 +347,11 @@ class DragPanController:
             and self._anchor is not None
             and self._scroll_anchor is not None
         ):
+            # Offsets derive from the cursor position alone, so an unchanged
+            # position would only repeat the same (costly) clamp.
+            if event.pos == self._last_pos:
+                return True
+            self._last_pos = event.pos
             mx, my = event.pos
             ax, ay = self._anchor
             sx, sy = self._scroll_anchor
@@ -1,7 +1,9 @@
 # klondike.py - Klondike scenes with flip-on-click, auto-finish, and win message
 import json
 import os
-from typing import Any, Dict, Optional
+import random
+from collections import namedtuple
+from typing import Any, Dict, List, Optional
 
 import pygame
 from solitaire import common as C
@@ -63,7 +65,33 @@ def load_saved_game() -> Optional[Dict[str, Any]]:
         return None
     return state
 
-def is_red(suit): return suit in (1,2)
+# Suit index -> colour bit (0 = black: spades/clubs, 1 = red: hearts/diamonds)
+_SUIT_COLOR = (0, 1, 1, 0)
+
+def is_red(suit): return _SUIT_COLOR[suit] == 1
+
+
+# Undo/restart snapshot. Each pile is stored as bytes, one packed card per byte
+# (see _pack). Building one is a bytes() call instead of 52 Card copies, and
+# whole snapshots hash and compare at bytes level.
+Snapshot = namedtuple("Snapshot", "foundations stock waste tableau stock_cycles_used")
+
+
+def _pack(c: C.Card) -> int:
+    return (c.suit << 6) | (c.rank << 1) | (1 if c.face_up else 0)
+
+
+def _unpack(b: int) -> C.Card:
+    return C.Card(b >> 6, (b >> 1) & 31, bool(b & 1))
+
+
+def _pack_pile(cards) -> bytes:
+    return bytes(_pack(c) for c in cards)
+
+
+def _unpack_pile(packed: bytes) -> List[C.Card]:
+    return [_unpack(b) for b in packed]
+
 
 # -----------------------------
 # Game Scene
@@ -87,14 +115,24 @@ class KlondikeGameScene(C.Scene):
         self.stock_pile = C.Pile(0, 0)
         self.waste_pile = C.Pile(0, 0)
         self.tableau = [C.Pile(0, 0, fan_y=0) for _ in range(7)]
-        self.undo_mgr = C.UndoManager()
+        # Pile objects never change (only their positions/cards), so iterate one fixed tuple
+        self._all_piles = (*self.foundations, self.stock_pile, self.waste_pile, *self.tableau)
+        self._upper_piles = (*self.foundations, self.stock_pile, self.waste_pile)
+        # The scene's own 52 cards, reshuffled by every deal_new
+        self._deck_cards = C.make_deck(shuffle=False)
+        # Undo log of small move records (see undo()); full snapshots are kept only for restart
+        self.undo_log: List[tuple] = []
+        # Cards on the foundations, kept current by moves/undo; 52 means the game is won
+        self._found_total = 0
         self.message = ""
         self.drag_stack = None
+        # Idle frames are skipped until something changes what is on screen
+        self._dirty = True
 
         self.ui_helper = ModeUIHelper(self, game_id="klondike")
 
         def can_undo():
-            return self.undo_mgr.can_undo()
+            return bool(self.undo_log)
 
         def save_and_exit() -> None:
             self._save_game(to_menu=True)
@@ -125,6 +163,9 @@ class KlondikeGameScene(C.Scene):
 
         # Klondike-style delayed single-card peek (shared across modes)
         self.peek = M.PeekController(delay_ms=2000)
+        # Latest hover position (world coords) awaiting a peek hit-test; motion
+        # events only record it and draw() tests once per frame.
+        self._pending_peek_pos = None
 
         # Layout depends on current card size and screen size
         self.compute_layout()
@@ -168,18 +209,41 @@ class KlondikeGameScene(C.Scene):
             t.y = row2_y
             t.fan_y = fan_y
 
+        # Pile positions only move here, so cache the extents that don't depend on pile contents
+        piles = self._all_piles
+        self._static_bounds_x = (min(p.x for p in piles), max(p.x + C.CARD_W for p in piles))
+        self._static_bottom_y = max(p.y + C.CARD_H for p in self._upper_piles)
+
+        # Drop targets are rebuilt from the new positions on the next drag
+        self._drop_rects = None
+
+        # Scrollbar tracks depend only on the window size (compute_layout runs on resize)
+        self._vsb_track = pygame.Rect(C.SCREEN_W - 12, top_bar_h, 6, C.SCREEN_H - top_bar_h - 10)
+        self._hsb_track = pygame.Rect(10, C.SCREEN_H - 16, C.SCREEN_W - 20, 6)
+
+        # Static labels: render once instead of every frame
+        self._lbl_stock = C.FONT_SMALL.render("Stock", True, (245,245,245))
+        self._lbl_stock_dx = (C.CARD_W - self._lbl_stock.get_width()) // 2
+        self._lbl_waste = C.FONT_SMALL.render("Waste", True, (245,245,245))
+        self._lbl_waste_dx = (C.CARD_W - self._lbl_waste.get_width()) // 2
+        # Suit glyphs for empty foundations, indexed by suit (foundation_suits may be reloaded)
+        self._suit_labels = []
+        for suit_char in C.SUITS:
+            txt = C.FONT_CENTER_SUIT.render(suit_char, True, C.WHITE)
+            dx = C.CARD_W // 2 - txt.get_width() // 2
+            dy = C.CARD_H // 2 - txt.get_height() // 2
+            self._suit_labels.append((txt, dx, dy))
+
     # ---------- Scrolling helpers ----------
     def _content_bottom_y(self) -> int:
         # Estimate the maximum Y occupied by content (foundations/tableau)
-        bottoms = []
-        bottoms.append(self.stock_pile.y + C.CARD_H)
-        bottoms.append(self.waste_pile.y + C.CARD_H)
-        for f in self.foundations:
-            bottoms.append(f.y + C.CARD_H)
+        bottom = self._static_bottom_y
         for t in self.tableau:
             n = max(1, len(t.cards))
-            bottoms.append(t.y + (n-1)*t.fan_y + C.CARD_H)
-        return max(bottoms) if bottoms else C.SCREEN_H
+            b = t.y + (n-1)*t.fan_y + C.CARD_H
+            if b > bottom:
+                bottom = b
+        return bottom
 
     def _clamp_scroll(self):
         # Allow scrolling upward to reveal content bottom, but not past the top
@@ -191,14 +255,8 @@ class KlondikeGameScene(C.Scene):
             self.scroll_y = 0
 
     def _content_bounds_x(self):
-        # Compute min left and max right of content (foundations, stock/waste, tableau)
-        lefts = []
-        rights = []
-        piles = self.foundations + [self.stock_pile, self.waste_pile] + self.tableau
-        for p in piles:
-            lefts.append(p.x)
-            rights.append(p.x + C.CARD_W)
-        return (min(lefts) if lefts else 0, max(rights) if rights else C.SCREEN_W)
+        # Min left and max right of content (foundations, stock/waste, tableau); cached by compute_layout
+        return self._static_bounds_x
 
     def _clamp_scroll_xy(self):
         # Clamp Y using existing helper
@@ -220,6 +278,7 @@ class KlondikeGameScene(C.Scene):
         for f in self.foundations: f.cards = []
         self.waste_pile.cards = []
         self.stock_pile.cards = []
+        self._found_total = 0
         self.drag_stack = None
         self.message = ""
 
@@ -227,26 +286,27 @@ class KlondikeGameScene(C.Scene):
         _clear_saved_game()
         # Reset & redeal
         self._clear_all_piles()
-        deck = C.make_deck(shuffle=True)
+        # Reuse the scene's cards rather than allocating a new deck; turn them all
+        # face down so only each column's last card needs flipping
+        deck = self._deck_cards[:]
+        random.shuffle(deck)
+        for c in deck: c.face_up = False
 
         for col in range(7):
-            for r in range(col+1):
-                c = deck.pop()
-                c.face_up = (r == col)
-                self.tableau[col].cards.append(c)
+            row_cards = [deck.pop() for _ in range(col+1)]
+            row_cards[-1].face_up = True
+            self.tableau[col].cards = row_cards
 
         self.stock_pile.cards = deck
-        for c in self.stock_pile.cards:
-            c.face_up = False
 
         self.stock_cycles_used = 0
 
         # Reset undo
-        self.undo_mgr = C.UndoManager()
-        self.push_undo()
+        self.undo_log = []
         self._initial_snapshot = self.record_snapshot()
 
         self.auto_play_active = False
+        self._dirty = True
 
     def restart(self):
         if getattr(self, "_initial_snapshot", None):
@@ -254,38 +314,41 @@ class KlondikeGameScene(C.Scene):
             self.drag_stack = None
             self.message = ""
             self.auto_play_active = False
-            self.undo_mgr = C.UndoManager()
-            self.push_undo()
+            self.undo_log = []
 
-    def _snapshot_to_state(self, snapshot: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    def _snapshot_to_state(self, snapshot: Optional[Snapshot]) -> Optional[Dict[str, Any]]:
         if not snapshot:
             return None
 
-        def cap_cards(cards):
-            return [(c.suit, c.rank, c.face_up) for c in cards]
+        def cap_cards(packed):
+            return [(c.suit, c.rank, c.face_up) for c in _unpack_pile(packed)]
 
         return {
-            "foundations": [cap_cards(p) for p in snapshot.get("foundations", [])],
-            "stock": cap_cards(snapshot.get("stock", [])),
-            "waste": cap_cards(snapshot.get("waste", [])),
-            "tableau": [cap_cards(p) for p in snapshot.get("tableau", [])],
-            "stock_cycles_used": snapshot.get("stock_cycles_used", 0),
+            "foundations": [cap_cards(p) for p in snapshot.foundations],
+            "stock": cap_cards(snapshot.stock),
+            "waste": cap_cards(snapshot.waste),
+            "tableau": [cap_cards(p) for p in snapshot.tableau],
+            "stock_cycles_used": snapshot.stock_cycles_used,
         }
 
-    def _snapshot_from_state(self, data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    def _snapshot_from_state(self, data: Optional[Dict[str, Any]]) -> Optional[Snapshot]:
         if not data:
             return None
 
         def mk(seq):
-            return [C.Card(int(s), int(r), bool(f)) for (s, r, f) in seq]
-
-        return {
-            "foundations": [mk(p) for p in data.get("foundations", [])],
-            "stock": mk(data.get("stock", [])),
-            "waste": mk(data.get("waste", [])),
-            "tableau": [mk(p) for p in data.get("tableau", [])],
-            "stock_cycles_used": int(data.get("stock_cycles_used", 0)),
-        }
+            return _pack_pile([C.Card(int(s), int(r), bool(f)) for (s, r, f) in seq])
+
+        def mk_piles(seqs, count):
+            seqs = list(seqs)[:count]
+            return tuple(mk(p) for p in seqs) + tuple(mk([]) for _ in range(count - len(seqs)))
+
+        return Snapshot(
+            foundations=mk_piles(data.get("foundations", []), len(self.foundations)),
+            stock=mk(data.get("stock", [])),
+            waste=mk(data.get("waste", [])),
+            tableau=mk_piles(data.get("tableau", []), len(self.tableau)),
+            stock_cycles_used=int(data.get("stock_cycles_used", 0)),
+        )
 
     def _state_dict(self) -> Dict[str, Any]:
         def cap(cards):
@@ -336,48 +399,105 @@ class KlondikeGameScene(C.Scene):
         self.message = state.get("message", "")
         self.scroll_x = state.get("scroll_x", 0)
         self.scroll_y = state.get("scroll_y", 0)
+        self._recount_foundations()
         self.draw_count = int(state.get("draw_count", self.draw_count))
         self.stock_cycles_allowed = state.get("stock_cycles_allowed", self.stock_cycles_allowed)
         self.stock_cycles_used = int(state.get("stock_cycles_used", 0))
         self.auto_play_active = bool(state.get("auto_play_active", False))
+        # Resume a saved auto-finish from now, not from the scene's creation
+        self.auto_last_time = pygame.time.get_ticks()
         init_snap = self._snapshot_from_state(state.get("initial_snapshot"))
         self._initial_snapshot = init_snap or self.record_snapshot()
         self.drag_stack = None
-        self.undo_mgr = C.UndoManager()
-        self.push_undo()
-        self.peek.cancel()
+        self.undo_log = []
+        self._cancel_peek()
         self._clamp_scroll_xy()
 
     # ---------- Undo helpers ----------
-    def record_snapshot(self):
-        return {
-            "foundations": [[C.Card(c.suit, c.rank, c.face_up) for c in f.cards] for f in self.foundations],
-            "stock": [C.Card(c.suit, c.rank, c.face_up) for c in self.stock_pile.cards],
-            "waste": [C.Card(c.suit, c.rank, c.face_up) for c in self.waste_pile.cards],
-            "tableau": [[C.Card(c.suit, c.rank, c.face_up) for c in p.cards] for p in self.tableau],
-            "stock_cycles_used": self.stock_cycles_used
-        }
-
-    def restore_snapshot(self, snap):
-        for i,f in enumerate(self.foundations):
-            f.cards = [C.Card(c.suit, c.rank, c.face_up) for c in snap["foundations"][i]]
-        self.stock_pile.cards = [C.Card(c.suit, c.rank, c.face_up) for c in snap["stock"]]
-        self.waste_pile.cards = [C.Card(c.suit, c.rank, c.face_up) for c in snap["waste"]]
-        for i,p in enumerate(self.tableau):
-            p.cards = [C.Card(c.suit, c.rank, c.face_up) for c in snap["tableau"][i]]
-        self.stock_cycles_used = snap["stock_cycles_used"]
-
-    def push_undo(self):
-        snap = self.record_snapshot()
-        self.undo_mgr.push(lambda s=snap: self.restore_snapshot(s))
+    def record_snapshot(self) -> Snapshot:
+        foundations = tuple(_pack_pile(f.cards) for f in self.foundations)
+        stock = _pack_pile(self.stock_pile.cards)
+        waste = _pack_pile(self.waste_pile.cards)
+        tableau = tuple(_pack_pile(p.cards) for p in self.tableau)
+        return Snapshot(foundations, stock, waste, tableau, self.stock_cycles_used)
+
+    def restore_snapshot(self, snap: Snapshot):
+        for f, packed in zip(self.foundations, snap.foundations):
+            f.cards = _unpack_pile(packed)
+        self.stock_pile.cards = _unpack_pile(snap.stock)
+        self.waste_pile.cards = _unpack_pile(snap.waste)
+        for p, packed in zip(self.tableau, snap.tableau):
+            p.cards = _unpack_pile(packed)
+        self.stock_cycles_used = snap.stock_cycles_used
+        self._recount_foundations()
+        self._dirty = True
+
+    def _recount_foundations(self):
+        self._found_total = sum(len(f.cards) for f in self.foundations)
+
+    # Undo records (pile ids: 0-3 foundations, 4 stock, 5 waste, 6-12 tableau):
+    #   ("move", src, dst, n, flipped)  n cards moved src -> dst; flipped if src's new top was turned up
+    #   ("draw", n)                     n cards dealt stock -> waste
+    #   ("recycle",)                    waste turned back over into the stock
+    #   ("flip", pile_id)               face-down top card turned up
+    def push_undo(self, record: tuple):
+        self.undo_log.append(record)
+
+    def _commit_move(self, src: int, dst: int, n: int):
+        # Cards are already on dst; turn up the card the move uncovered and record
+        # both together. Only src can change here: a face-down top left elsewhere
+        # (an undone flip) stays down until the player clicks it again.
+        src_cards = self._all_piles[src].cards
+        flipped = bool(src_cards) and not src_cards[-1].face_up
+        if flipped:
+            src_cards[-1].face_up = True
+        self.push_undo(("move", src, dst, n, flipped))
+        self._found_total += n * ((dst < 4) - (src < 4))
+        self.post_move_cleanup()
 
     def undo(self):
-        if self.undo_mgr.can_undo():
-            self.undo_mgr.undo()
-            self.auto_play_active = False
+        if not self.undo_log:
+            return
+        record = self.undo_log.pop()
+        kind = record[0]
+        if kind == "move":
+            _, src, dst, n, flipped = record
+            src_cards = self._all_piles[src].cards
+            dst_cards = self._all_piles[dst].cards
+            if flipped and src_cards:
+                src_cards[-1].face_up = False
+            moved = dst_cards[-n:]
+            del dst_cards[-n:]
+            src_cards.extend(moved)
+            self._found_total -= n * ((dst < 4) - (src < 4))
+        elif kind == "draw":
+            waste = self.waste_pile.cards
+            moved = waste[-record[1]:]
+            del waste[-record[1]:]
+            moved.reverse()
+            for c in moved:
+                c.face_up = False
+            self.stock_pile.cards.extend(moved)
+        elif kind == "recycle":
+            cards = self.stock_pile.cards
+            cards.reverse()
+            for c in cards:
+                c.face_up = True
+            self.waste_pile.cards = cards
+            self.stock_pile.cards = []
+            self.stock_cycles_used -= 1
+        elif kind == "flip":
+            self._all_piles[record[1]].cards[-1].face_up = False
+        self.auto_play_active = False
+        self._dirty = True
+
+    def _cancel_peek(self):
+        self._pending_peek_pos = None
+        self.peek.cancel()
 
     # ---------- Gameplay helpers ----------
     def draw_from_stock(self):
+        self._dirty = True
         if not self.stock_pile.cards:
             if not self.waste_pile.cards:
                 return
@@ -385,10 +505,14 @@ class KlondikeGameScene(C.Scene):
                 if self.stock_cycles_used >= self.stock_cycles_allowed:
                     self.message = "No more stock cycles!"
                     return
-            self.stock_pile.cards = [C.Card(c.suit,c.rank,False) for c in reversed(self.waste_pile.cards)]
-            for c in self.stock_pile.cards: c.face_up = False
-            self.waste_pile.cards.clear()
+            # Turn the waste over in place; the same Card objects become the stock
+            cards = self.waste_pile.cards
+            cards.reverse()
+            for c in cards: c.face_up = False
+            self.stock_pile.cards = cards
+            self.waste_pile.cards = []
             self.stock_cycles_used += 1
+            self.push_undo(("recycle",))
             return
         n = min(self.draw_count, len(self.stock_pile.cards))
         moved = []
@@ -397,12 +521,13 @@ class KlondikeGameScene(C.Scene):
             c.face_up = True
             moved.append(c)
         self.waste_pile.cards.extend(moved)
+        self.push_undo(("draw", n))
         self.message = ""
 
     def can_stack_tableau(self, upper: C.Card, lower: C.Card):
-        if not lower or not upper: return False
-        return ((upper.suit in (0,3) and lower.suit in (1,2)) or
-                (upper.suit in (1,2) and lower.suit in (0,3))) and (upper.rank == lower.rank - 1)
+        if upper is None or lower is None: return False
+        # Colour bits differ exactly when their XOR is 1
+        return (_SUIT_COLOR[upper.suit] ^ _SUIT_COLOR[lower.suit]) == 1 and upper.rank == lower.rank - 1
 
     def can_move_to_empty_tableau(self, card: C.Card):
         return card.rank == 13  # King
@@ -438,16 +563,15 @@ class KlondikeGameScene(C.Scene):
                 c = self.waste_pile.cards[-1]
                 fi = self._foundation_index_for_suit(c.suit)
                 if self.can_move_to_foundation(c, fi):
-                    self.push_undo()
                     self.waste_pile.cards.pop()
                     self.foundations[fi].cards.append(c)
-                    self.post_move_cleanup()
+                    self._commit_move(5, fi, 1)
                     handled = True
             # Tableau top cards
             if not handled:
                 for ti, t in enumerate(self.tableau):
                     hi = t.hit((mxw, myw))
-                    if hi is None:
+                    if hi is None or not t.cards:
                         continue
                     if hi == -1 and t.cards:
                         hi = len(t.cards) - 1
@@ -455,10 +579,9 @@ class KlondikeGameScene(C.Scene):
                         c = t.cards[-1]
                         fi = self._foundation_index_for_suit(c.suit)
                         if self.can_move_to_foundation(c, fi):
-                            self.push_undo()
                             t.cards.pop()
                             self.foundations[fi].cards.append(c)
-                            self.post_move_cleanup()
+                            self._commit_move(6 + ti, fi, 1)
                             handled = True
                             break
         # Update click tracking (always)
@@ -479,10 +602,8 @@ class KlondikeGameScene(C.Scene):
         return False
 
     def post_move_cleanup(self):
-        for p in self.tableau:
-            if p.cards and not p.cards[-1].face_up:
-                p.cards[-1].face_up = True
-        if all(len(f.cards)==13 for f in self.foundations):
+        self._dirty = True
+        if self._found_total == 52:
             self.message = "🎉 Congratulations! You won! Press N for a new game."
             _clear_saved_game()
 
@@ -497,12 +618,18 @@ class KlondikeGameScene(C.Scene):
         return True
 
     def _find_next_auto_move(self):
+        # Each foundation holds one suit in rank order, so its length is the
+        # rank it has reached: a tableau top fits iff rank == length + 1.
+        fi_by_suit = [0] * 4
+        for fi, suit in enumerate(self.foundation_suits):
+            fi_by_suit[suit] = fi
+        foundations = self.foundations
         for ti, t in enumerate(self.tableau):
             if not t.cards: continue
             c = t.cards[-1]
-            for fi in range(4):
-                if self.can_move_to_foundation(c, fi):
-                    return (ti, fi)
+            fi = fi_by_suit[c.suit]
+            if len(foundations[fi].cards) == c.rank - 1:
+                return (ti, fi)
         return None
 
     def start_auto_finish(self):
@@ -512,23 +639,31 @@ class KlondikeGameScene(C.Scene):
         self.auto_last_time = pygame.time.get_ticks()
 
     def step_auto_finish(self):
+        self._dirty = True
         nxt = self._find_next_auto_move()
         if not nxt:
             self.auto_play_active = False
-            if all(len(f.cards)==13 for f in self.foundations):
+            if self._found_total == 52:
                 self.message = "🎉 Congratulations! You won! Press N for a new game."
                 _clear_saved_game()
             return
         ti, fi = nxt
         c = self.tableau[ti].cards.pop()
         self.foundations[fi].cards.append(c)
-        if self.tableau[ti].cards and not self.tableau[ti].cards[-1].face_up:
-            self.tableau[ti].cards[-1].face_up = True
+        self._commit_move(6 + ti, fi, 1)
 
     # ---------- Events ----------
+    def handle_events(self, events):
+        # Motion is only ever read for the latest pointer position (drag ghost, hover
+        # peek, toolbar, scrollbar drags)
+        super().handle_events(C.coalesce_motion(events))
+
     def handle_event(self, e):
-        # Always track mouse position for edge panning
-        if e.type == pygame.MOUSEMOTION:
+        # Any input may change hover state, scroll, or piles; repaint on the next frame
+        self._dirty = True
+        # Always track mouse position for edge panning (presses too, so a drag
+        # that starts without motion still pans from the right spot)
+        if e.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
             self.edge_pan.on_mouse_pos(e.pos)
         # Help overlay intercepts input when visible
         if getattr(self, "help", None) and self.help.visible:
@@ -553,7 +688,7 @@ class KlondikeGameScene(C.Scene):
             return
 
         if self.drag_pan.handle_event(e, target=self, clamp=self._clamp_scroll_xy):
-            self.peek.cancel()
+            self._cancel_peek()
             return
 
         # Mouse wheel scrolling (supports trackpads: e.x horizontal, e.y vertical)
@@ -566,7 +701,7 @@ class KlondikeGameScene(C.Scene):
                 pass
             self._clamp_scroll_xy()
             # Scrolling cancels peek state
-            self.peek.cancel()
+            self._cancel_peek()
             return
 
         # Scrollbar interactions (mouse)
@@ -609,9 +744,7 @@ class KlondikeGameScene(C.Scene):
         # Hover peek when not dragging scrollbars or stacks
         if e.type == pygame.MOUSEMOTION and not getattr(self, "_drag_vscroll", False) and not getattr(self, "_drag_hscroll", False) and not self.drag_stack:
             mx, my = e.pos
-            mxw = mx - self.scroll_x
-            myw = my - self.scroll_y
-            self.peek.on_motion_over_piles(self.tableau, (mxw, myw))
+            self._pending_peek_pos = (mx - self.scroll_x, my - self.scroll_y)
 
         if e.type == pygame.MOUSEBUTTONUP and e.button == 1:
             self._drag_vscroll = False
@@ -623,20 +756,25 @@ class KlondikeGameScene(C.Scene):
                 y = min(max(e.pos[1] - self._vscroll_drag_dy, track_y), track_y + track_h - knob_h)
                 t_knob = (y - track_y) / max(1, (track_h - knob_h))
                 t = 1.0 - t_knob
-                self.scroll_y = min_sy + t * (max_sy - min_sy)
-                self._clamp_scroll_xy()
+                scroll_y = min_sy + t * (max_sy - min_sy)
+                # Knob pinned at a track end (or no vertical change): nothing to re-clamp
+                if scroll_y != self.scroll_y:
+                    self.scroll_y = scroll_y
+                    self._clamp_scroll_xy()
                 return
             if getattr(self, "_drag_hscroll", False):
                 min_sx, max_sx, track_x, track_w, knob_w = self._hscroll_geom
                 x = min(max(e.pos[0] - self._hscroll_drag_dx, track_x), track_x + track_w - knob_w)
                 t_knob = (x - track_x) / max(1, (track_w - knob_w))
-                self.scroll_x = min_sx + t_knob * (max_sx - min_sx)
-                self._clamp_scroll_xy()
+                scroll_x = min_sx + t_knob * (max_sx - min_sx)
+                if scroll_x != self.scroll_x:
+                    self.scroll_x = scroll_x
+                    self._clamp_scroll_xy()
                 return
 
         if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
             # Any click clears peek state
-            self.peek.cancel()
+            self._cancel_peek()
             mx, my = e.pos
             mxw = mx - self.scroll_x
             myw = my - self.scroll_y  # convert to world coords for hit-tests
@@ -648,28 +786,30 @@ class KlondikeGameScene(C.Scene):
                 return
             # Stock
             if pygame.Rect(self.stock_pile.x, self.stock_pile.y, C.CARD_W, C.CARD_H).collidepoint((mxw,myw)):
-                self.push_undo(); self.draw_from_stock(); return
+                self.draw_from_stock(); return
             # Waste
             wi = self.waste_pile.hit((mxw,myw))
-            if wi is not None and wi == len(self.waste_pile.cards)-1:
+            if wi is not None and wi != -1 and wi == len(self.waste_pile.cards)-1:
                 c = self.waste_pile.cards.pop()
-                self.drag_stack = ([c], ("waste", None)); self.edge_pan.set_active(True); return
+                self._start_drag([c], ("waste", None)); return
             # Foundations
             for fi,f in enumerate(self.foundations):
                 hi = f.hit((mxw,myw))
                 if hi is not None and hi == len(f.cards)-1 and f.cards:
                     c = f.cards.pop()
-                    self.drag_stack = ([c], ("foundation", fi)); self.edge_pan.set_active(True); return
+                    self._start_drag([c], ("foundation", fi)); return
             # Tableau
             for ti,t in enumerate(self.tableau):
+                # Columns don't fan sideways, so only the one under the pointer can hit
+                if not (t.x <= mxw < t.x + C.CARD_W): continue
                 hi = t.hit((mxw,myw))
-                if hi is None: continue
+                if hi is None or hi == -1: continue
                 if hi == len(t.cards)-1 and not t.cards[hi].face_up:
                     t.cards[hi].face_up = True
-                    self.push_undo(); return
+                    self.push_undo(("flip", 6 + ti)); return
                 if hi != -1 and t.cards[hi].face_up:
-                    seq = t.cards[hi:]; t.cards = t.cards[:hi]
-                    self.drag_stack = (seq, ("tableau", ti)); self.edge_pan.set_active(True); return
+                    seq = t.cards[hi:]; del t.cards[hi:]
+                    self._start_drag(seq, ("tableau", ti)); return
 
         elif e.type == pygame.MOUSEBUTTONUP and e.button == 1:
             if not self.drag_stack: return
@@ -677,35 +817,59 @@ class KlondikeGameScene(C.Scene):
             mx, my = e.pos
             mxw = mx - self.scroll_x
             myw = my - self.scroll_y
-            # Foundations
-            for fi,f in enumerate(self.foundations):
-                if f.top_rect().collidepoint((mxw,myw)) and len(stack)==1:
-                    c = stack[0]
-                    if self.can_move_to_foundation(c, fi):
-                        self.push_undo(); f.cards.append(c); self.post_move_cleanup(); return
+            origin, idx = from_info
+            src = 5 if origin == "waste" else (idx if origin == "foundation" else 6 + idx)
+            if self._drop_rects is None:
+                self._drop_rects = self._build_drop_rects()
+            found_rects, tab_rects = self._drop_rects
+            probe = pygame.Rect(mxw, myw, 1, 1)
+            # Foundations (drop targets never overlap, so the first hit is the only one)
+            fi = probe.collidelist(found_rects)
+            if fi != -1 and len(stack)==1:
+                c = stack[0]
+                if self.can_move_to_foundation(c, fi):
+                    self.foundations[fi].cards.append(c); self._commit_move(src, fi, 1); return
             # Tableau
-            for ti,t in enumerate(self.tableau):
-                if t.top_rect().collidepoint((mxw,myw)):
-                    if self.drop_stack_on_tableau(stack, t):
-                        self.push_undo(); self.post_move_cleanup(); return
+            ti = probe.collidelist(tab_rects)
+            if ti != -1:
+                if self.drop_stack_on_tableau(stack, self.tableau[ti]):
+                    self._commit_move(src, 6 + ti, len(stack)); return
             # Return to origin
-            origin, idx = from_info
             if origin == "waste": self.waste_pile.cards.extend(stack)
             elif origin == "foundation": self.foundations[idx].cards.extend(stack)
             elif origin == "tableau": self.tableau[idx].cards.extend(stack)
 
+    def _build_drop_rects(self):
+        return ([f.top_rect() for f in self.foundations],
+                [t.top_rect() for t in self.tableau])
+
+    def _start_drag(self, stack, from_info):
+        self.drag_stack = (stack, from_info)
+        self.edge_pan.set_active(True)
+        # Piles can't change until the drop, so the targets are fixed for the whole drag
+        self._drop_rects = self._build_drop_rects()
+        # Composite the dragged cards once; each frame then blits a single surface
+        ghost = pygame.Surface((C.CARD_W, C.CARD_H + (len(stack) - 1) * 28), pygame.SRCALPHA)
+        for i, c in enumerate(stack):
+            ghost.blit(C.get_card_surface(c), (0, i * 28))
+        self._drag_surface = ghost
+
+    def wants_realtime(self):
+        return self.auto_play_active or self.drag_stack is not None
+
     # ---------- Drawing ----------
     def draw(self, screen):
-        screen.fill(C.TABLE_BG)
-
+        now = pygame.time.get_ticks()
+        # Fixed-cadence auto-finish: catch up on every step that fell due since the
+        # last frame (a slow frame no longer stretches the animation), then draw once.
+        # A long stall only owes a couple of steps, so it can't finish the game at once.
         if self.auto_play_active:
-            now = pygame.time.get_ticks()
-            if now - self.auto_last_time >= self.auto_interval_ms:
-                self.step_auto_finish()
-                self.auto_last_time = now
+            self.auto_last_time = max(self.auto_last_time, now - 2 * self.auto_interval_ms)
+        while self.auto_play_active and now - self.auto_last_time >= self.auto_interval_ms:
+            self.step_auto_finish()
+            self.auto_last_time += self.auto_interval_ms
 
-        # Edge panning while dragging near the screen edges
-        self.edge_pan.on_mouse_pos(pygame.mouse.get_pos())
+        # Edge panning while dragging near the screen edges (position fed by handle_event)
         has_v = self._vertical_scrollbar() is not None
         has_h = self._horizontal_scrollbar() is not None
         dx, dy = self.edge_pan.step(has_h_scroll=has_h, has_v_scroll=has_v)
@@ -714,6 +878,27 @@ class KlondikeGameScene(C.Scene):
             self.scroll_y += dy
             self._clamp_scroll_xy()
 
+        overlay_before = self.peek.overlay
+        # Hit-test only the last hover position seen since the previous frame
+        if self._pending_peek_pos is not None:
+            if not self.drag_stack:
+                self.peek.on_motion_over_piles(self.tableau, self._pending_peek_pos)
+            self._pending_peek_pos = None
+        # If a peek is pending and delay elapsed, activate it even without mouse movement
+        self.peek.maybe_activate(now)
+        if self.peek.overlay is not overlay_before:
+            self._dirty = True
+
+        # Nothing changed since the last frame: the previous image is still on screen
+        # (auto-finish steps mark the frame dirty, so the wait between them stays idle)
+        if not self._dirty and not self.drag_stack:
+            self.idle_frame = True
+            return
+        self._dirty = False
+        self.idle_frame = False
+
+        screen.fill(C.TABLE_BG)
+
         extra = ("Stock cycles: unlimited" if self.stock_cycles_allowed is None
                  else f"Stock cycles used: {self.stock_cycles_used}/{self.stock_cycles_allowed}")
 
@@ -721,35 +906,50 @@ class KlondikeGameScene(C.Scene):
         C.DRAW_OFFSET_X = self.scroll_x
         C.DRAW_OFFSET_Y = self.scroll_y
 
-        # If a peek is pending and delay elapsed, activate it even without mouse movement
-        self.peek.maybe_activate(pygame.time.get_ticks())
-
+        # Gather every visible card into one blit sequence and hand it to
+        # Surface.blits in a single call; empty piles still draw their outline.
+        ox, oy = self.scroll_x, self.scroll_y
+        card_surface = C.get_card_surface
+        # Every face-down card shares one back surface; resolve it once per repaint
+        back = C.get_back_surface()
+        blits = []
         for i,f in enumerate(self.foundations):
-            f.draw(screen)
-            # Draw suit character (plain white) on empty foundation placeholder
-            if not f.cards:
-                suit_i = self.foundation_suits[i]
-                suit_char = C.SUITS[suit_i]
-                txt = C.FONT_CENTER_SUIT.render(suit_char, True, C.WHITE)
-                cx = f.x + C.CARD_W // 2 + self.scroll_x
-                cy = f.y + C.CARD_H // 2 + self.scroll_y
-                screen.blit(txt, (cx - txt.get_width() // 2, cy - txt.get_height() // 2))
-
-        self.stock_pile.draw(screen)
-        lab = C.FONT_SMALL.render("Stock", True, (245,245,245))
-        screen.blit(lab, (self.stock_pile.x + (C.CARD_W - lab.get_width())//2 + self.scroll_x, self.stock_pile.y - 22 + self.scroll_y))
-        self.waste_pile.draw(screen)
-        lab2 = C.FONT_SMALL.render("Waste", True, (245,245,245))
-        screen.blit(lab2, (self.waste_pile.x + (C.CARD_W - lab2.get_width())//2 + self.scroll_x, self.waste_pile.y - 22 + self.scroll_y))
+            if f.cards:
+                pos = (f.x + ox, f.y + oy)
+                blits += [(card_surface(c), pos) for c in f.cards]
+            else:
+                f.draw(screen)
+                # Draw suit character (plain white) on empty foundation placeholder
+                txt, dx, dy = self._suit_labels[self.foundation_suits[i]]
+                screen.blit(txt, (f.x + dx + ox, f.y + dy + oy))
+
+        for p in (self.stock_pile, self.waste_pile):
+            if p.cards:
+                pos = (p.x + ox, p.y + oy)
+                blits += [(card_surface(c) if c.face_up else back, pos) for c in p.cards]
+            else:
+                p.draw(screen)
+        screen.blit(self._lbl_stock, (self.stock_pile.x + self._lbl_stock_dx + ox, self.stock_pile.y - 22 + oy))
+        screen.blit(self._lbl_waste, (self.waste_pile.x + self._lbl_waste_dx + ox, self.waste_pile.y - 22 + oy))
 
         for t in self.tableau:
-            t.draw(screen)
+            # Cull columns scrolled entirely out of view
+            x0 = t.x + ox
+            y0 = t.y + oy
+            fy = t.fan_y
+            y1 = y0 + max(0, len(t.cards) - 1) * fy + C.CARD_H
+            if y1 < 0 or y0 > C.SCREEN_H or x0 + C.CARD_W < 0 or x0 > C.SCREEN_W:
+                continue
+            if t.cards:
+                blits += [(card_surface(c) if c.face_up else back, (x0, y0 + i * fy))
+                          for i, c in enumerate(t.cards)]
+            else:
+                t.draw(screen)
+        screen.blits(blits, doreturn=False)
 
         if self.drag_stack:
-            stack,_ = self.drag_stack; mx,my = pygame.mouse.get_pos()
-            for i,c in enumerate(stack):
-                surf = C.get_card_surface(c)
-                screen.blit(surf, (mx - C.CARD_W//2, my - C.CARD_H//2 + i*28))
+            mx,my = pygame.mouse.get_pos()
+            screen.blit(self._drag_surface, (mx - C.CARD_W//2, my - C.CARD_H//2))
         elif getattr(self, 'peek', None) and self.peek.overlay:
             c, rx, ry = self.peek.overlay
             surf = C.get_card_surface(c)
@@ -790,13 +990,10 @@ class KlondikeGameScene(C.Scene):
         bottom = self._content_bottom_y()
         if bottom <= C.SCREEN_H:
             return None
-        track_x = C.SCREEN_W - 12
-        track_y = getattr(C, "TOP_BAR_H", 64)
-        track_h = C.SCREEN_H - track_y - 10
-        track_rect = pygame.Rect(track_x, track_y, 6, track_h)
-        view_h = C.SCREEN_H
+        track_rect = self._vsb_track
+        track_x, track_y, _, track_h = track_rect
         content_h = bottom
-        knob_h = max(30, int(track_h * (view_h / content_h)))
+        knob_h = max(30, int(track_h * (C.SCREEN_H / content_h)))
         max_scroll = 0
         min_scroll = C.SCREEN_H - bottom - 20
         denom = (max_scroll - min_scroll)
@@ -809,10 +1006,8 @@ class KlondikeGameScene(C.Scene):
         left, right = self._content_bounds_x()
         if right - left <= C.SCREEN_W - 40:
             return None
-        track_x = 10
-        track_w = C.SCREEN_W - 20
-        track_y = C.SCREEN_H - 10
-        track_rect = pygame.Rect(track_x, track_y-6, track_w, 6)
+        track_rect = self._hsb_track
+        track_x, track_top, track_w, _ = track_rect
         view_w = C.SCREEN_W
         content_w = right - left + 40
         knob_w = max(30, int(track_w * (view_w / max(view_w, content_w))))
@@ -821,5 +1016,5 @@ class KlondikeGameScene(C.Scene):
         denom = (max_scroll_x - min_scroll_x)
         t = (self.scroll_x - min_scroll_x) / denom if denom != 0 else 1.0
         knob_x = int(track_x + (track_w - knob_w) * t)
-        knob_rect = pygame.Rect(knob_x, track_y-6, knob_w, 6)
+        knob_rect = pygame.Rect(knob_x, track_top, knob_w, 6)
         return track_rect, knob_rect, min_scroll_x, max_scroll_x, track_x, track_w, knob_w
@@ -4,10 +4,18 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import random
+from collections import deque
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
 
 import pygame
 
+try:  # optional: much faster (de)serialisation for save files
+    import orjson
+except ImportError:
+    orjson = None
+
 from solitaire import common as C
 from solitaire import mechanics as M
 from solitaire.modes.base_scene import ModeUIHelper, ScrollableSceneMixin
@@ -15,8 +23,15 @@ from solitaire.help_data import create_modal_help
 
 
 _SAVE_FILENAME = "monte_carlo_save.json"
+# Save schema: v2 stores each card as one packed int (v1 used {"suit", "rank", "face_up"} dicts)
+_SAVE_VERSION = 2
 _ROWS = 5
 _COLS = 5
+_UNDO_DEPTH = 20
+# Forward half of the 8-neighbourhood: scanning cells in row-major order with
+# these offsets visits every adjacent pair exactly once
+_FORWARD_NEIGHBOURS = ((0, 1), (1, -1), (1, 0), (1, 1))
+_ALL_NEIGHBOURS = ((-1, -1), (-1, 0), (-1, 1), (0, -1)) + _FORWARD_NEIGHBOURS
 
 
 def _data_dir() -> str:
@@ -27,19 +42,39 @@ def _save_path() -> str:
     return os.path.join(_data_dir(), _SAVE_FILENAME)
 
 
-def _safe_write_json(path: str, payload: Dict[str, Any]) -> None:
+def _safe_write_json(path: str, payload: Dict[str, Any]) -> bool:
+    """Write ``payload`` to ``path``; return False if the save did not land."""
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump(payload, fh, indent=2)
+        # Serialise in memory first so the file is written with a single call.
+        # Saves are only read back by the game, so skip indentation and spaces.
+        if orjson is not None:
+            data = orjson.dumps(payload)
+        else:
+            data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    except Exception:
+        return False
+    # Write beside the target and swap it in, so a crash never leaves a torn save
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
     except Exception:
-        pass
+        # Don't leave a partial temp file behind after a failed write or swap
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return False
+    return True
 
 
 def _safe_read_json(path: str) -> Optional[Dict[str, Any]]:
     try:
-        with open(path, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        with open(path, "rb") as fh:
+            raw = fh.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         return None
     if isinstance(data, dict):
@@ -48,20 +83,33 @@ def _safe_read_json(path: str) -> Optional[Dict[str, Any]]:
 
 
 def _clear_saved_game() -> None:
-    try:
-        if os.path.isfile(_save_path()):
-            os.remove(_save_path())
-    except Exception:
-        pass
+    # Also drop a temp file stranded by a write that was interrupted mid-swap
+    for path in (_save_path(), _save_path() + ".tmp"):
+        try:
+            if os.path.isfile(path):
+                os.remove(path)
+        except Exception:
+            pass
+
+
+# (mtime_ns, size) of the save file last inspected by has_saved_game, and the answer
+_has_save_cache: Optional[Tuple[Tuple[int, int], bool]] = None
 
 
 def has_saved_game() -> bool:
-    state = _safe_read_json(_save_path())
-    if not isinstance(state, dict):
-        return False
-    if state.get("completed"):
+    # The options modal asks every frame; stat the file and only parse it when it changed
+    global _has_save_cache
+    try:
+        st = os.stat(_save_path())
+    except OSError:
         return False
-    return True
+    key = (st.st_mtime_ns, st.st_size)
+    if _has_save_cache is not None and _has_save_cache[0] == key:
+        return _has_save_cache[1]
+    state = _safe_read_json(_save_path())
+    result = isinstance(state, dict) and not state.get("completed")
+    _has_save_cache = (key, result)
+    return result
 
 
 def load_saved_game() -> Optional[Dict[str, Any]]:
@@ -73,15 +121,53 @@ def load_saved_game() -> Optional[Dict[str, Any]]:
     return state
 
 
-def _card_to_dict(card: C.Card) -> Dict[str, Any]:
-    return {"suit": int(card.suit), "rank": int(card.rank), "face_up": bool(card.face_up)}
+def _card_to_data(card: C.Card) -> int:
+    return (int(card.suit) << 8) | (int(card.rank) << 1) | int(bool(card.face_up))
+
+
+def _is_card_data(data: Any) -> bool:
+    return isinstance(data, (int, dict)) and not isinstance(data, bool)
+
+
+def _decode_card(data: Any) -> Tuple[int, int, bool]:
+    if isinstance(data, dict):  # v1 saves
+        return int(data.get("suit", 0)), int(data.get("rank", 1)), bool(data.get("face_up", False))
+    value = int(data)
+    return value >> 8, (value >> 1) & 0x7F, bool(value & 1)
+
+
+# Full-screen translucent overlays keyed by (width, height, alpha); cleared on relayout
+_dim_cache: Dict[Tuple[int, int, int], pygame.Surface] = {}
 
 
-def _card_from_dict(data: Dict[str, Any]) -> C.Card:
-    suit = int(data.get("suit", 0))
-    rank = int(data.get("rank", 1))
-    face_up = bool(data.get("face_up", False))
-    return C.Card(suit, rank, face_up)
+def _dim_surface(alpha: int) -> pygame.Surface:
+    key = (C.SCREEN_W, C.SCREEN_H, alpha)
+    surf = _dim_cache.get(key)
+    if surf is None:
+        surf = pygame.Surface((C.SCREEN_W, C.SCREEN_H), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, alpha))
+        _dim_cache[key] = surf
+    return surf
+
+
+def _neighbour_table(
+    rows: int, cols: int, offsets: Sequence[Tuple[int, int]]
+) -> List[List[Tuple[Tuple[int, int], ...]]]:
+    # For every cell, the in-bounds cells at the given offsets
+    return [
+        [
+            tuple((r + dr, c + dc) for dr, dc in offsets if 0 <= r + dr < rows and 0 <= c + dc < cols)
+            for c in range(cols)
+        ]
+        for r in range(rows)
+    ]
+
+
+@lru_cache(maxsize=64)
+def _render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    # Labels, status messages and modal text come from a small fixed set of
+    # strings; render each one once
+    return font.render(text, True, color)
 
 
 class _FoundationModal:
@@ -92,10 +178,18 @@ class _FoundationModal:
         self.visible: bool = False
         self.cards: List[C.Card] = []
         self._close_btn = C.Button("Close", 0, 0, w=200, h=46, center=False)
+        # Smoothscaled card faces for the current thumbnail size, keyed by (suit, rank, face_up)
+        self._scaled_cache: Dict[Tuple[int, int, bool], pygame.Surface] = {}
+        self._scaled_size: Optional[Tuple[int, int]] = None
+        # _layout() result, reused until the card count, window, card size or fonts change
+        self._layout_key: Optional[Tuple[Any, ...]] = None
+        self._layout_value: Optional[Tuple[Any, ...]] = None
 
     def open(self, cards: Sequence[C.Card]) -> None:
         self.cards = list(cards)
         self.visible = True
+        # Card art may have changed since the last opening
+        self._scaled_cache.clear()
 
     def close(self) -> None:
         self.visible = False
@@ -112,17 +206,13 @@ class _FoundationModal:
             if self._close_btn.hovered(event.pos):
                 self.close()
             return True
-        if event.type == pygame.MOUSEMOTION:
-            self._layout()
         return True
 
     def draw(self, screen: pygame.Surface) -> None:
         if not self.visible:
             return
 
-        dim = pygame.Surface((C.SCREEN_W, C.SCREEN_H), pygame.SRCALPHA)
-        dim.fill((0, 0, 0, 180))
-        screen.blit(dim, (0, 0))
+        screen.blit(_dim_surface(180), (0, 0))
 
         panel, positions, card_size, title_surf, info_surf = self._layout()
 
@@ -136,28 +226,48 @@ class _FoundationModal:
             screen.blit(info_surf, (panel.centerx - info_surf.get_width() // 2, y))
             y += info_surf.get_height() + 6
 
-        for card, (cx, cy) in zip(self.cards, positions):
-            surf = C.get_card_surface(card)
-            if card_size != (C.CARD_W, C.CARD_H):
-                surf = pygame.transform.smoothscale(surf, card_size)
-            screen.blit(surf, (cx, cy))
+        if card_size != self._scaled_size:
+            self._scaled_cache.clear()
+            self._scaled_size = card_size
+        scale = card_size != (C.CARD_W, C.CARD_H)
+        blits = []
+        for card, pos in zip(self.cards, positions):
+            if scale:
+                key = (card.suit, card.rank, card.face_up)
+                surf = self._scaled_cache.get(key)
+                if surf is None:
+                    surf = pygame.transform.smoothscale(C.get_card_surface(card), card_size)
+                    self._scaled_cache[key] = surf
+            else:
+                surf = C.get_card_surface(card)
+            blits.append((surf, pos))
+        screen.blits(blits, doreturn=False)
 
         mouse_pos = pygame.mouse.get_pos()
         self._close_btn.draw(screen, hover=self._close_btn.hovered(mouse_pos))
 
     def _layout(
         self,
+    ) -> Tuple[pygame.Rect, List[Tuple[int, int]], Tuple[int, int], pygame.Surface, Optional[pygame.Surface]]:
+        key = (self.title, len(self.cards), C.SCREEN_W, C.SCREEN_H, C.CARD_W, C.CARD_H, id(C.FONT_TITLE), id(C.FONT_UI))
+        if key != self._layout_key or self._layout_value is None:
+            self._layout_value = self._compute_layout()
+            self._layout_key = key
+        return self._layout_value  # type: ignore[return-value]
+
+    def _compute_layout(
+        self,
     ) -> Tuple[pygame.Rect, List[Tuple[int, int]], Tuple[int, int], pygame.Surface, Optional[pygame.Surface]]:
         pad = 28
         gap = max(12, C.CARD_W // 8)
         title_font = C.FONT_TITLE if C.FONT_TITLE is not None else pygame.font.SysFont(pygame.font.get_default_font(), 38, bold=True)
-        title_surf = title_font.render(self.title, True, (28, 28, 34))
+        title_surf = _render_text(title_font, self.title, (28, 28, 34))
 
         total_cards = len(self.cards)
         if total_cards:
             info_text = f"Pairs removed: {total_cards // 2}" if total_cards % 2 == 0 else f"Cards: {total_cards}"
             info_font = C.FONT_UI if C.FONT_UI is not None else pygame.font.SysFont(pygame.font.get_default_font(), 24, bold=True)
-            info_surf: Optional[pygame.Surface] = info_font.render(info_text, True, (42, 42, 52))
+            info_surf: Optional[pygame.Surface] = _render_text(info_font, info_text, (42, 42, 52))
         else:
             info_surf = None
 
@@ -177,21 +287,24 @@ class _FoundationModal:
             return panel, [], (C.CARD_W, C.CARD_H), title_surf, info_surf
 
         best_layout: Optional[Tuple[int, int, float]] = None
-        max_cols = len(self.cards)
-        for cols in range(1, max_cols + 1):
-            rows = (len(self.cards) + cols - 1) // cols
+        total = len(self.cards)
+        # Only the narrowest column count for each row count can win: widening a grid
+        # without saving a row only shrinks scale_w. So visit those O(sqrt(N)) candidates.
+        cols = 1
+        while cols <= total:
+            rows = (total + cols - 1) // cols
             inner_w = cols * C.CARD_W
             inner_h = rows * C.CARD_H
             scale_w = min(1.0, (avail_w - 2 * pad - (cols - 1) * gap) / inner_w)
             usable_h = avail_h - top_height - bottom_height - (rows - 1) * gap
-            if usable_h <= 0:
-                continue
-            scale_h = min(1.0, usable_h / inner_h)
-            scale = min(scale_w, scale_h)
-            if scale <= 0:
-                continue
-            if best_layout is None or scale > best_layout[2]:
-                best_layout = (cols, rows, scale)
+            if usable_h > 0:
+                scale_h = min(1.0, usable_h / inner_h)
+                scale = min(scale_w, scale_h)
+                if scale > 0 and (best_layout is None or scale > best_layout[2]):
+                    best_layout = (cols, rows, scale)
+            if rows == 1:
+                break
+            cols = (total + rows - 2) // (rows - 1)  # fewest columns that need fewer rows
 
         if best_layout is None:
             cols = min(len(self.cards), 6)
@@ -234,6 +347,7 @@ class _GameOverPrompt:
     def __init__(self, on_new_game: Callable[[], None], on_quit: Callable[[], None]) -> None:
         self.visible: bool = False
         self.message: str = ""
+        self._lines: List[str] = []
         self._panel_rect = pygame.Rect(0, 0, 0, 0)
         self._on_new_game = on_new_game
         self._on_quit = on_quit
@@ -242,6 +356,7 @@ class _GameOverPrompt:
 
     def open(self, message: str) -> None:
         self.message = message
+        self._lines = [line.strip() for line in message.splitlines() if line.strip()] or [message]
         self.visible = True
         self._layout()
 
@@ -262,9 +377,6 @@ class _GameOverPrompt:
                 self._on_quit()
                 return True
             return True
-        if event.type == pygame.MOUSEMOTION:
-            self._layout()
-            return False
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self._new_btn.hovered(event.pos):
                 self._on_new_game()
@@ -282,9 +394,7 @@ class _GameOverPrompt:
         if not self.visible:
             return
 
-        overlay = pygame.Surface((C.SCREEN_W, C.SCREEN_H), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 170))
-        surface.blit(overlay, (0, 0))
+        surface.blit(_dim_surface(170), (0, 0))
 
         self._layout()
         panel = self._panel_rect
@@ -292,14 +402,13 @@ class _GameOverPrompt:
         pygame.draw.rect(surface, (90, 90, 100), panel, width=2, border_radius=18)
 
         title_font = C.FONT_TITLE or pygame.font.SysFont(pygame.font.get_default_font(), 38, bold=True)
-        title = title_font.render("No Moves Remaining", True, (40, 40, 50))
+        title = _render_text(title_font, "No Moves Remaining", (40, 40, 50))
         surface.blit(title, (panel.centerx - title.get_width() // 2, panel.top + 24))
 
         msg_font = C.FONT_UI or pygame.font.SysFont(pygame.font.get_default_font(), 24)
-        lines = [line.strip() for line in self.message.splitlines() if line.strip()] or [self.message]
         y = panel.top + 24 + title.get_height() + 16
-        for line in lines:
-            surf = msg_font.render(line, True, (40, 40, 45))
+        for line in self._lines:
+            surf = _render_text(msg_font, line, (40, 40, 45))
             surface.blit(surf, (panel.centerx - surf.get_width() // 2, y))
             y += surf.get_height() + 6
 
@@ -334,6 +443,13 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
     def __init__(self, app, load_state: Optional[Dict[str, Any]] = None):
         super().__init__(app)
         self.tableau: List[List[Optional[C.Card]]] = [[None for _ in range(self.cols)] for _ in range(self.rows)]
+        # Empty tableau cells; recounted when the grid is replaced, adjusted on pair/fill
+        self._gap_count: int = self.rows * self.cols
+        # Whether any adjacent pair matches; None until asked after a board change
+        self._pairs_cache: Optional[bool] = None
+        # The grid never changes shape, so each cell's neighbours are fixed
+        self._neighbours = _neighbour_table(self.rows, self.cols, _ALL_NEIGHBOURS)
+        self._forward_neighbours = _neighbour_table(self.rows, self.cols, _FORWARD_NEIGHBOURS)
         self.stock_pile = C.Pile(0, 0)
         self.matched_pile = C.Pile(0, 0, fan_y=0)
         self.selection: Optional[Tuple[int, int]] = None
@@ -346,10 +462,15 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
         self._gap_x: int = getattr(C, "CARD_GAP_X", max(16, C.CARD_W // 6))
         self._gap_y: int = getattr(C, "CARD_GAP_Y", max(20, C.CARD_H // 6))
         self.anim: M.CardAnimator = M.CardAnimator()
-        self._move_queue: List[Dict[str, Any]] = []
+        self._move_queue: Deque[Dict[str, Any]] = deque()
         self._post_queue_callback: Optional[Callable[[], None]] = None
         self._pending_layout_after_compact: Optional[List[List[Optional[C.Card]]]] = None
-        self._undo_stack: List[Dict[str, Any]] = []
+        # Oldest snapshots fall off the left once the depth limit is reached
+        self._undo_stack: Deque[Tuple[Any, ...]] = deque(maxlen=_UNDO_DEPTH)
+        # The scene's 52 cards; deals, restarts and loads reuse them instead of allocating
+        self._card_pool: Dict[Tuple[int, int], C.Card] = {
+            (suit, rank): C.Card(suit, rank, False) for suit in range(4) for rank in range(1, 14)
+        }
         self.hint_cells: Optional[List[Tuple[int, int]]] = None
         self.hint_expires_at: int = 0
 
@@ -416,9 +537,12 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
 
         self.compute_layout()
 
+        # What the save file holds for this game, as _serialise_state produces it
+        self._last_saved_state: Optional[Dict[str, Any]] = None
         if load_state:
             self._load_from_state(load_state)
             self._undo_stack.clear()
+            self._last_saved_state = self._serialise_state()
         else:
             self.new_game(clear_save=True)
 
@@ -440,17 +564,33 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
 
         self.matched_pile.x = stock_x
         self.matched_pile.y = top_y + C.CARD_H + self._gap_y
+        # Neither pile fans, so each one's click target is its base card slot
+        self._stock_click_rect = pygame.Rect(self.stock_pile.x, self.stock_pile.y, C.CARD_W, C.CARD_H)
+        self._matched_click_rect = pygame.Rect(self.matched_pile.x, self.matched_pile.y, C.CARD_W, C.CARD_H)
 
         self._grid_left = stock_x + C.CARD_W + self._gap_x
         self._grid_top = top_y
-
+        # World-space rect of every cell; only changes here, so callers share
+        # these rects and must not mutate them
+        step_x = C.CARD_W + self._gap_x
+        step_y = C.CARD_H + self._gap_y
+        self._cell_rects: List[List[pygame.Rect]] = [
+            [
+                pygame.Rect(self._grid_left + col * step_x, self._grid_top + row * step_y, C.CARD_W, C.CARD_H)
+                for col in range(self.cols)
+            ]
+            for row in range(self.rows)
+        ]
+
+        _dim_cache.clear()
         if hasattr(self, "toolbar") and self.toolbar:
             self.toolbar.relayout()
         self.ui_helper.relayout_menu_modal()
         self._clamp_scroll()
 
     def new_game(self, *, clear_save: bool = True) -> None:
-        deck = C.make_deck(shuffle=True)
+        deck = list(self._card_pool.values())
+        random.shuffle(deck)
         self._initial_order = [(card.suit, card.rank) for card in deck]
         self._deal_from_deck(deck)
         if clear_save:
@@ -460,22 +600,31 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
         if not self._initial_order:
             self.new_game()
             return
-        deck = [C.Card(s, r, False) for (s, r) in self._initial_order]
+        deck = [self._pooled_card(s, r, False) for (s, r) in self._initial_order]
         self._deal_from_deck(deck)
         _clear_saved_game()
 
-    def _deal_from_deck(self, deck_cards: Sequence[C.Card]) -> None:
+    def _deal_from_deck(self, deck: List[C.Card]) -> None:
+        # Takes ownership of deck: both callers build a fresh list of pooled cards,
+        # so deal from it directly instead of copying it
         self._cancel_animations()
-        deck: List[C.Card] = [C.Card(card.suit, card.rank, False) for card in deck_cards]
-        self.tableau = [[None for _ in range(self.cols)] for _ in range(self.rows)]
-        for row in range(self.rows):
+        for card in deck:
+            card.face_up = False
+        # Deal from the top (end) of the deck; whatever is left underneath is the stock
+        dealt = min(len(deck), self.rows * self.cols)
+        top = reversed(deck)
+        if len(self.tableau) != self.rows or any(len(row) != self.cols for row in self.tableau):
+            self.tableau = [[None] * self.cols for _ in range(self.rows)]
+        # Refill the existing row lists in place; undo snapshots hold their own copies
+        for row in self.tableau:
             for col in range(self.cols):
-                if not deck:
-                    self.tableau[row][col] = None
-                    continue
-                card = deck.pop()
-                card.face_up = True
-                self.tableau[row][col] = card
+                card = next(top, None)
+                if card is not None:
+                    card.face_up = True
+                row[col] = card
+        self._recount_gaps()
+        self._pairs_cache = None
+        del deck[len(deck) - dealt:]
         self.stock_pile.cards = deck
         self.matched_pile.cards = []
         self.selection = None
@@ -488,6 +637,13 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
         self._clear_hint()
         self.reset_scroll()
 
+    def _pooled_card(self, suit: int, rank: int, face_up: bool) -> C.Card:
+        card = self._card_pool.get((suit, rank))
+        if card is None:  # out-of-range data, e.g. from a damaged save
+            return C.Card(suit, rank, face_up)
+        card.face_up = face_up
+        return card
+
     def _cancel_animations(self) -> None:
         self.anim.cancel()
         self._move_queue.clear()
@@ -497,16 +653,17 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
 
     # ----- Persistence -----
     def _serialise_state(self, *, completed: Optional[bool] = None) -> Dict[str, Any]:
-        tableau_data: List[List[Optional[Dict[str, Any]]]] = []
+        tableau_data: List[List[Optional[int]]] = []
         for row in self.tableau:
-            tableau_row: List[Optional[Dict[str, Any]]] = []
+            tableau_row: List[Optional[int]] = []
             for card in row:
-                tableau_row.append(_card_to_dict(card) if card is not None else None)
+                tableau_row.append(_card_to_data(card) if card is not None else None)
             tableau_data.append(tableau_row)
         state = {
+            "v": _SAVE_VERSION,
             "tableau": tableau_data,
-            "stock": [_card_to_dict(card) for card in self.stock_pile.cards],
-            "matched": [_card_to_dict(card) for card in self.matched_pile.cards],
+            "stock": [_card_to_data(card) for card in self.stock_pile.cards],
+            "matched": [_card_to_data(card) for card in self.matched_pile.cards],
             "selection": list(self.selection) if self.selection else None,
             "message": self.message,
             "game_over": self.game_over,
@@ -518,7 +675,13 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
 
     def _save_game(self, *, to_menu: bool = False) -> None:
         state = self._serialise_state()
-        _safe_write_json(_save_path(), state)
+        # Saving again with nothing changed since the last load/save would
+        # rewrite identical bytes; skip it while the file is still there
+        if state != self._last_saved_state or not os.path.isfile(_save_path()):
+            # Only remember the state once it is on disk, so a failed write
+            # is retried by the next save instead of being skipped as unchanged
+            if _safe_write_json(_save_path(), state):
+                self._last_saved_state = state
         if to_menu:
             self.ui_helper.goto_main_menu()
 
@@ -533,10 +696,9 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
                 for entry in row:
                     if entry is None:
                         new_row.append(None)
-                    elif isinstance(entry, dict):
-                        card = _card_from_dict(entry)
-                        card.face_up = True
-                        new_row.append(card)
+                    elif _is_card_data(entry):
+                        suit, rank, _ = _decode_card(entry)
+                        new_row.append(self._pooled_card(suit, rank, True))
             rows.append(new_row)
         while len(rows) < self.rows:
             rows.append([None for _ in range(self.cols)])
@@ -545,24 +707,24 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
                 row.extend([None] * (self.cols - len(row)))
             rows[idx] = row[: self.cols]
         self.tableau = rows[: self.rows]
+        self._recount_gaps()
+        self._pairs_cache = None
 
         stock_data = state.get("stock", [])
         self.stock_pile.cards = []
         if isinstance(stock_data, list):
             for entry in stock_data:
-                if isinstance(entry, dict):
-                    card = _card_from_dict(entry)
-                    card.face_up = False
-                    self.stock_pile.cards.append(card)
+                if _is_card_data(entry):
+                    suit, rank, _ = _decode_card(entry)
+                    self.stock_pile.cards.append(self._pooled_card(suit, rank, False))
 
         matched_data = state.get("matched", [])
         self.matched_pile.cards = []
         if isinstance(matched_data, list):
             for entry in matched_data:
-                if isinstance(entry, dict):
-                    card = _card_from_dict(entry)
-                    card.face_up = True
-                    self.matched_pile.cards.append(card)
+                if _is_card_data(entry):
+                    suit, rank, _ = _decode_card(entry)
+                    self.matched_pile.cards.append(self._pooled_card(suit, rank, True))
 
         sel = state.get("selection")
         if isinstance(sel, (list, tuple)) and len(sel) == 2:
@@ -640,7 +802,7 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
         if not self._move_queue:
             self._check_queue_complete()
             return
-        move = self._move_queue.pop(0)
+        move = self._move_queue.popleft()
 
         card = move.get("card")
         if card is None:
@@ -689,91 +851,119 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
     def undo_last_pair(self) -> None:
         if not self.can_undo():
             return
-        state = self._undo_stack.pop()
-        self._load_from_state(state)
+        self._restore_snapshot(self._undo_stack.pop())
         self.message = "Previous move restored."
 
+    def _snapshot(self) -> Tuple[Any, ...]:
+        # Undo-only snapshot: the Card objects themselves, never serialised.
+        # Cards only change pile between pushes, so holding references is enough.
+        return (
+            tuple(tuple(row) for row in self.tableau),
+            tuple(self.stock_pile.cards),
+            tuple(self.matched_pile.cards),
+            self.selection,
+            self.message,
+            self.game_over,
+            self.did_win,
+        )
+
+    def _restore_snapshot(self, snapshot: Tuple[Any, ...]) -> None:
+        self._cancel_animations()
+        self.game_over_prompt.close()
+        tableau, stock, matched, selection, message, game_over, did_win = snapshot
+        self.tableau = [list(row) for row in tableau]
+        self._recount_gaps()
+        self._pairs_cache = None
+        for row in self.tableau:
+            for card in row:
+                if card is not None:
+                    card.face_up = True
+        self.stock_pile.cards = list(stock)
+        for card in self.stock_pile.cards:
+            card.face_up = False
+        self.matched_pile.cards = list(matched)
+        for card in self.matched_pile.cards:
+            card.face_up = True
+        self.selection = selection
+        self.message = message
+        self.game_over = game_over
+        self.did_win = did_win
+        self.reset_scroll()
+        self.foundation_modal.close()
+
     def _push_undo_state(self) -> None:
-        snapshot = self._serialise_state(completed=False)
-        self._undo_stack.append(snapshot)
-        max_depth = 20
-        if len(self._undo_stack) > max_depth:
-            self._undo_stack.pop(0)
+        self._undo_stack.append(self._snapshot())
 
     def _simulate_compact_layout(
         self,
+        *,
+        record_moves: bool = True,
     ) -> Tuple[
         List[List[Optional[C.Card]]],
         List[Tuple[C.Card, Tuple[int, int], Tuple[int, int]]],
     ]:
         layout = [list(row) for row in self.tableau]
         moves: List[Tuple[C.Card, Tuple[int, int], Tuple[int, int]]] = []
-        self._compact_rows_on_grid(layout, moves)
-        self._compact_columns_on_grid(layout, moves)
-        self._compact_rows_on_grid(layout, moves)
+        # Move bookkeeping is optional; callers that only want the layout skip it
+        log = moves if record_moves else None
+        self._compact_rows_on_grid(layout, log)
+        self._compact_columns_on_grid(layout, log)
+        self._compact_rows_on_grid(layout, log)
         return layout, moves
 
     def _compact_rows_on_grid(
         self,
         grid: List[List[Optional[C.Card]]],
         moves: Optional[List[Tuple[C.Card, Tuple[int, int], Tuple[int, int]]]] = None,
-    ) -> None:
-        if not grid:
-            return
-        cols = len(grid[0])
+    ) -> bool:
+        # Slide every row's cards to the right end, keeping their order. Shifts
+        # each row in place, walking right to left; returns whether anything moved.
+        changed = False
         for row_idx, row in enumerate(grid):
-            while True:
-                leftmost = next((c for c, card in enumerate(row) if card is not None), None)
-                if leftmost is None:
-                    break
-                moved = False
-                for col in range(cols - 1, leftmost, -1):
-                    if row[col] is not None:
-                        continue
-                    source_col = None
-                    for src in range(col - 1, -1, -1):
-                        if row[src] is not None:
-                            source_col = src
-                            break
-                    if source_col is None:
-                        continue
-                    card = row[source_col]
-                    row[source_col] = None
-                    row[col] = card
-                    if moves is not None and card is not None:
-                        moves.append((card, (row_idx, source_col), (row_idx, col)))
-                    moved = True
-                    break
-                if not moved:
-                    break
+            write = len(row) - 1
+            row_moves = []
+            for read in range(write, -1, -1):
+                card = row[read]
+                if card is None:
+                    continue
+                if read != write:
+                    row[write] = card
+                    row[read] = None
+                    changed = True
+                    if moves is not None:
+                        row_moves.append((card, (row_idx, read), (row_idx, write)))
+                write -= 1
+            if row_moves:
+                # Report moves left to right, as the rows read on screen
+                moves.extend(reversed(row_moves))
+        return changed
 
     def _compact_columns_on_grid(
         self,
         grid: List[List[Optional[C.Card]]],
         moves: Optional[List[Tuple[C.Card, Tuple[int, int], Tuple[int, int]]]] = None,
     ) -> None:
+        # Lift every column's cards to the top, keeping their order: one pass per column
         if not grid:
             return
         rows = len(grid)
         cols = len(grid[0])
-        for col in reversed(range(cols)):
-            for row in range(rows):
-                card = grid[row][col]
-                if card is None:
-                    continue
-                current_row = row
-                while current_row > 0 and grid[current_row - 1][col] is None:
-                    grid[current_row - 1][col] = card
-                    grid[current_row][col] = None
-                    if moves is not None:
-                        moves.append((card, (current_row, col), (current_row - 1, col)))
-                    current_row -= 1
+        for col in range(cols):
+            present = [(r, grid[r][col]) for r in range(rows) if grid[r][col] is not None]
+            for dest, (src, card) in enumerate(present):
+                if moves is not None and src != dest:
+                    moves.append((card, (src, col), (dest, col)))
+                grid[dest][col] = card
+            for r in range(len(present), rows):
+                grid[r][col] = None
 
     def _apply_compacted_layout_and_fill(self) -> None:
         layout = self._pending_layout_after_compact
         self._pending_layout_after_compact = None
         if layout is not None:
-            self.tableau = [list(row) for row in layout]
+            # _simulate_compact_layout built this grid from fresh row lists; take it as is
+            self.tableau = layout
+            self._pairs_cache = None
         if not self.stock_pile.cards or not self._has_gaps():
             self._on_compact_sequence_complete()
             return
@@ -786,7 +976,7 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
                 if not self.stock_pile.cards:
                     break
                 if self.tableau[row][col] is None:
-                    dest_rect = self._cell_rect(row, col)
+                    dest_xy = self._cell_rects[row][col].topleft
                     card_holder: List[Optional[C.Card]] = [None]
 
                     def _get_card(holder: List[Optional[C.Card]] = card_holder) -> Optional[C.Card]:
@@ -804,12 +994,15 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
                     ) -> None:
                         card_ref = holder[0]
                         if card_ref is not None:
+                            if self.tableau[r][c] is None:
+                                self._gap_count -= 1
                             self.tableau[r][c] = card_ref
+                            self._pairs_cache = None
 
                     self._queue_move(
                         None,
                         (self.stock_pile.x, self.stock_pile.y),
-                        (dest_rect.x, dest_rect.y),
+                        dest_xy,
                         card_getter=_get_card,
                         on_complete=_place,
                         dur_ms=260,
@@ -857,15 +1050,15 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
             return False
         return self._has_gaps()
 
+    def _recount_gaps(self) -> None:
+        self._gap_count = sum(row.count(None) for row in self.tableau)
+
     def _has_gaps(self) -> bool:
-        for row in self.tableau:
-            for card in row:
-                if card is None:
-                    return True
-        return False
+        # Polled every frame by the toolbar's Compact enabled-check
+        return self._gap_count > 0
 
     def _is_full(self) -> bool:
-        return not self._has_gaps()
+        return self._gap_count == 0
 
     def iter_scroll_piles(self):  # type: ignore[override]
         yield self.stock_pile
@@ -881,25 +1074,23 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
         return left, top, right, bottom
 
     def _cell_rect(self, row: int, col: int) -> pygame.Rect:
-        x = self._grid_left + col * (C.CARD_W + self._gap_x)
-        y = self._grid_top + row * (C.CARD_H + self._gap_y)
-        return pygame.Rect(x, y, C.CARD_W, C.CARD_H)
+        return self._cell_rects[row][col]
 
     def _cell_at_point(self, pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        # The grid is uniform: find the slot arithmetically, then reject the gaps
         px, py = self._screen_to_world(pos)
-        for row in range(self.rows):
-            for col in range(self.cols):
-                rect = self._cell_rect(row, col)
-                if rect.collidepoint(px, py):
-                    return row, col
-        return None
+        dx = px - self._grid_left
+        dy = py - self._grid_top
+        if dx < 0 or dy < 0:
+            return None
+        col, ox = divmod(dx, C.CARD_W + self._gap_x)
+        row, oy = divmod(dy, C.CARD_H + self._gap_y)
+        if row >= self.rows or col >= self.cols or ox >= C.CARD_W or oy >= C.CARD_H:
+            return None
+        return int(row), int(col)
 
     def _cells_adjacent(self, a: Tuple[int, int], b: Tuple[int, int]) -> bool:
-        ra, ca = a
-        rb, cb = b
-        if ra == rb and ca == cb:
-            return False
-        return max(abs(ra - rb), abs(ca - cb)) == 1
+        return b in self._neighbours[a[0]][a[1]]
 
     def _remove_pair(self, first: Tuple[int, int], second: Tuple[int, int]) -> None:
         r1, c1 = first
@@ -911,6 +1102,8 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
         self._push_undo_state()
         self.tableau[r1][c1] = None
         self.tableau[r2][c2] = None
+        self._gap_count += 2
+        self._pairs_cache = None
         card1.face_up = True
         card2.face_up = True
         self.matched_pile.cards.append(card1)
@@ -921,10 +1114,8 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
         self._check_game_end()
 
     def _compact_rows(self) -> bool:
-        layout = [list(row) for row in self.tableau]
-        self._compact_rows_on_grid(layout)
-        if layout != self.tableau:
-            self.tableau = layout
+        if self._compact_rows_on_grid(self.tableau):
+            self._pairs_cache = None
             return True
         return False
 
@@ -933,6 +1124,7 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
         self._compact_columns_on_grid(layout)
         if layout != self.tableau:
             self.tableau = layout
+            self._pairs_cache = None
             return True
         return False
 
@@ -948,46 +1140,33 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
         self._undo_stack.clear()
         self._clear_hint()
 
-        layout, _ = self._simulate_compact_layout()
+        layout, _ = self._simulate_compact_layout(record_moves=False)
         self._pending_layout_after_compact = layout
         self._apply_compacted_layout_and_fill()
 
     def _has_matching_pairs(self) -> bool:
-        for row in range(self.rows):
-            for col in range(self.cols):
-                card = self.tableau[row][col]
-                if card is None:
-                    continue
-                for dr in (-1, 0, 1):
-                    for dc in (-1, 0, 1):
-                        if dr == 0 and dc == 0:
-                            continue
-                        nr = row + dr
-                        nc = col + dc
-                        if 0 <= nr < self.rows and 0 <= nc < self.cols:
-                            other = self.tableau[nr][nc]
-                            if other is not None and other.rank == card.rank:
-                                return True
-        return False
+        # Polled every frame by the toolbar's Hint enabled-check; rescan only
+        # after the board has changed
+        if self._pairs_cache is None:
+            self._pairs_cache = self._find_adjacent_matching_pair() is not None
+        return self._pairs_cache
 
     def _find_adjacent_matching_pair(
         self,
     ) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
-        for row in range(self.rows):
-            for col in range(self.cols):
-                card = self.tableau[row][col]
+        # A match with an earlier cell would already have been found from that
+        # cell, so only the forward neighbours need checking (same first pair
+        # as a full 8-neighbour scan)
+        tableau = self.tableau
+        for row, (cells, forward) in enumerate(zip(tableau, self._forward_neighbours)):
+            for col, card in enumerate(cells):
                 if card is None:
                     continue
-                for dr in (-1, 0, 1):
-                    for dc in (-1, 0, 1):
-                        if dr == 0 and dc == 0:
-                            continue
-                        nr = row + dr
-                        nc = col + dc
-                        if 0 <= nr < self.rows and 0 <= nc < self.cols:
-                            other = self.tableau[nr][nc]
-                            if other is not None and other.rank == card.rank:
-                                return (row, col), (nr, nc)
+                rank = card.rank
+                for nr, nc in forward[col]:
+                    other = tableau[nr][nc]
+                    if other is not None and other.rank == rank:
+                        return (row, col), (nr, nc)
         return None
 
     def _clear_hint(self) -> None:
@@ -1009,7 +1188,7 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
             self.message = "Try matching these cards."
 
     def _check_game_end(self) -> None:
-        if all(card is None for row in self.tableau for card in row) and not self.stock_pile.cards:
+        if self._gap_count == self.rows * self.cols and not self.stock_pile.cards:
             self.game_over = True
             self.did_win = True
             self.message = "You win!"
@@ -1022,31 +1201,47 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
             _clear_saved_game()
 
     # ----- Drawing -----
-    def draw(self, screen) -> None:
-        screen.fill(C.TABLE_BG)
+    def wants_realtime(self) -> bool:
+        return self._is_busy()
 
+    def draw(self, screen) -> None:
         if self.hint_cells and pygame.time.get_ticks() > self.hint_expires_at:
             self._clear_hint()
+            self._dirty = True
+
+        # Sampled before painting: the last queued move completes inside
+        # anim.draw below, after which _is_busy() already reads False
+        busy = self._is_busy()
+        # Nothing changed since the last frame: the previous image is still on screen
+        if not self._dirty and not busy:
+            self.idle_frame = True
+            return
+        self._dirty = False
+        self.idle_frame = False
+
+        screen.fill(C.TABLE_BG)
 
         with self.scrolling_draw_offset():
-            for row in range(self.rows):
-                for col in range(self.cols):
-                    rect = self._cell_rect(row, col)
-                    screen_rect = pygame.Rect(self._world_to_screen(rect.topleft), rect.size)
-                    card = self.tableau[row][col]
+            # Cells never overlap: gather every card into one Surface.blits call,
+            # then outline the hinted cards on top
+            ox, oy = self.scroll_x, self.scroll_y
+            card_surface = C.get_card_surface
+            draw_rect = pygame.draw.rect
+            radius = C.CARD_RADIUS
+            hint_cells = self.hint_cells or ()
+            blits = []
+            hinted = []
+            for row, (rects, cards) in enumerate(zip(self._cell_rects, self.tableau)):
+                for col, (rect, card) in enumerate(zip(rects, cards)):
                     if card is None:
-                        pygame.draw.rect(screen, (255, 255, 255, 60), screen_rect, border_radius=C.CARD_RADIUS, width=2)
+                        draw_rect(screen, (255, 255, 255, 60), rect.move(ox, oy), border_radius=radius, width=2)
                     else:
-                        surf = C.get_card_surface(card)
-                        screen.blit(surf, screen_rect.topleft)
-                        if self.hint_cells and (row, col) in self.hint_cells:
-                            pygame.draw.rect(
-                                screen,
-                                (70, 200, 255),
-                                screen_rect,
-                                width=4,
-                                border_radius=C.CARD_RADIUS,
-                            )
+                        blits.append((card_surface(card), (rect.x + ox, rect.y + oy)))
+                        if (row, col) in hint_cells:
+                            hinted.append(rect.move(ox, oy))
+            screen.blits(blits, doreturn=False)
+            for screen_rect in hinted:
+                draw_rect(screen, (70, 200, 255), screen_rect, width=4, border_radius=radius)
 
             if self.selection is not None:
                 sr, sc = self.selection
@@ -1060,7 +1255,7 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
             self.anim.draw(screen, scroll_x=self.scroll_x, scroll_y=self.scroll_y)
 
             font = C.FONT_SMALL if C.FONT_SMALL is not None else pygame.font.SysFont(pygame.font.get_default_font(), 20, bold=True)
-            stock_label = font.render("Stock", True, C.WHITE)
+            stock_label = _render_text(font, "Stock", C.WHITE)
             stock_pos = self._world_to_screen(
                 (
                     self.stock_pile.x + (C.CARD_W - stock_label.get_width()) // 2,
@@ -1068,7 +1263,7 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
                 )
             )
             screen.blit(stock_label, stock_pos)
-            foundation_label = font.render("Foundation", True, C.WHITE)
+            foundation_label = _render_text(font, "Foundation", C.WHITE)
             foundation_pos = self._world_to_screen(
                 (
                     self.matched_pile.x + (C.CARD_W - foundation_label.get_width()) // 2,
@@ -1079,7 +1274,7 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
 
         if self.message:
             msg_font = C.FONT_UI if C.FONT_UI is not None else pygame.font.SysFont(pygame.font.get_default_font(), 24, bold=True)
-            msg_surf = msg_font.render(self.message, True, (255, 255, 200))
+            msg_surf = _render_text(msg_font, self.message, (255, 255, 200))
             screen.blit(msg_surf, (C.SCREEN_W // 2 - msg_surf.get_width() // 2, C.SCREEN_H - 48))
 
         C.Scene.draw_top_bar(self, screen, "Monte Carlo")
@@ -1092,9 +1287,20 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
             self.foundation_modal.draw(screen)
         if self.game_over_prompt.visible:
             self.game_over_prompt.draw(screen)
+        # A move may have landed during this frame; paint the settled board
+        # (and refreshed toolbar states) once more
+        if busy:
+            self._dirty = True
 
     # ----- Event handling -----
+    def handle_events(self, events) -> None:
+        # Every handler in the ladder below reads motion only for the latest
+        # pointer position (hover, middle-button pan), so a burst of motion
+        # runs the ladder once instead of once per event
+        super().handle_events(C.coalesce_motion(events))
+
     def handle_event(self, event) -> None:
+        self._dirty = True
         if event.type == pygame.MOUSEMOTION:
             self.edge_pan.on_mouse_pos(event.pos)
 
@@ -1137,11 +1343,11 @@ class MonteCarloGameScene(ScrollableSceneMixin, C.Scene):
 
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             world_pos = self._screen_to_world(event.pos)
-            if self.stock_pile.top_rect().collidepoint(world_pos):
+            if self._stock_click_rect.collidepoint(world_pos):
                 if self.can_compact():
                     self.compact_and_fill()
                 return
-            if self.matched_pile.top_rect().collidepoint(world_pos) and self.matched_pile.cards:
+            if self.matched_pile.cards and self._matched_click_rect.collidepoint(world_pos):
                 self.foundation_modal.open(self.matched_pile.cards)
                 return
             if self.game_over:
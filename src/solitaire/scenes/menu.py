@@ -345,6 +345,8 @@ class MainMenuScene(C.Scene):
         self._options_proxy = None
         self._pending_open_key = open_game_key
         self._hover_entry: _GameEntry | None = None
+        # Mouse position the last drawn frame was rendered for (hover highlights)
+        self._last_draw_mp: tuple[int, int] | None = None
 
         icon_dir = os.path.join(os.path.dirname(C.__file__), "assets", "images", "game_icons")
         self._icon_dir = icon_dir
@@ -689,7 +691,12 @@ class MainMenuScene(C.Scene):
                 self._modal_open = False
             return
 
+    def wants_realtime(self):
+        # Menu and options only change in response to input
+        return False
+
     def handle_event(self, e):
+        self._dirty = True
         if self._options_modal is not None:
             should_close = False
             if e.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.KEYDOWN):
@@ -886,6 +893,14 @@ class MainMenuScene(C.Scene):
             btn.draw(screen, hover=btn.hovered(mp))
 
     def draw(self, screen):
+        mp = pygame.mouse.get_pos()
+        # Static until input arrives or the pointer moves (hover is read at draw time)
+        if not self._dirty and mp == self._last_draw_mp:
+            self.idle_frame = True
+            return
+        self._dirty = False
+        self.idle_frame = False
+        self._last_draw_mp = mp
         screen.fill(C.TABLE_BG)
         title = C.FONT_TITLE.render("Solitaire Suite", True, C.WHITE) if C.FONT_TITLE else pygame.font.SysFont(pygame.font.get_default_font(), 44, bold=True).render("Solitaire Suite", True, C.WHITE)
         screen.blit(title, (C.SCREEN_W // 2 - title.get_width() // 2, 110))
@@ -0,0 +1,33 @@
+import importlib
+
+import pytest
+
+
+@pytest.fixture
+def headless_screen(monkeypatch):
+    """Initialise pygame on the dummy video driver with real fonts loaded.
+
+    Game modes are loaded through ``game_mode`` inside the tests, never at
+    collection time, so test_app_flow can still install its font patches.
+    pygame is left initialised afterwards: module-level fonts such as ui.FONT
+    outlive the test, and rendering them after pygame.quit() crashes.
+    """
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    pygame = importlib.import_module("pygame")
+    pygame.init()
+    screen = pygame.display.set_mode((1024, 768))
+    importlib.import_module("solitaire.common").setup_fonts()
+    return screen
+
+
+@pytest.fixture
+def game_mode():
+    """Return a loader that imports ``solitaire.modes.<name>`` when called.
+
+    Importing a mode loads the UI fonts, so it must not happen at collection
+    time, before test_app_flow installs its dummy font patches.
+    """
+    def load(name):
+        return importlib.import_module(f"solitaire.modes.{name}")
+    return load
@@ -0,0 +1,42 @@
+import importlib
+
+import pygame
+import pytest
+
+SIZE = (100, 140)
+
+
+@pytest.fixture
+def common(headless_screen, monkeypatch, tmp_path):
+    C = importlib.import_module("solitaire.common")
+    monkeypatch.setattr(C, "IMAGE_CARDS_DIR", str(tmp_path))
+    C.invalidate_card_caches()
+    yield C
+    C.invalidate_card_caches()
+
+
+def _write_png(path):
+    pygame.image.save(pygame.Surface(SIZE), str(path))
+
+
+def test_missing_face_image_is_cached(common, tmp_path) -> None:
+    card = common.Card(0, 1, True)
+    assert common._get_image_face_surface(card, SIZE) is None
+    # A file that appears later is not picked up until the caches are invalidated
+    _write_png(tmp_path / "Spades 1.png")
+    assert common._get_image_face_surface(card, SIZE) is None
+
+
+def test_face_image_that_fails_to_load_is_retried(common, tmp_path) -> None:
+    card = common.Card(0, 1, True)
+    (tmp_path / "Spades 1.png").write_bytes(b"not a png")
+    assert common._get_image_face_surface(card, SIZE) is None
+    _write_png(tmp_path / "Spades 1.png")
+    assert common._get_image_face_surface(card, SIZE) is not None
+
+
+def test_back_image_that_fails_to_load_is_retried(common, tmp_path) -> None:
+    (tmp_path / "Back Blue 1.png").write_bytes(b"not a png")
+    assert common._get_image_back_surface(SIZE) is None
+    _write_png(tmp_path / "Back Blue 1.png")
+    assert common._get_image_back_surface(SIZE) is not None
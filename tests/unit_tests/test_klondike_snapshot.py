@@ -0,0 +1,24 @@
+import pytest
+
+
+@pytest.mark.parametrize("suit", range(4))
+@pytest.mark.parametrize("rank", range(1, 14))
+@pytest.mark.parametrize("face_up", [False, True])
+def test_pack_round_trip(game_mode, suit: int, rank: int, face_up: bool) -> None:
+    K = game_mode("klondike")
+    packed = K._pack(K.C.Card(suit, rank, face_up))
+    assert 0 <= packed < 256
+    card = K._unpack(packed)
+    assert (card.suit, card.rank, card.face_up) == (suit, rank, face_up)
+
+
+def test_pack_pile_round_trip(game_mode) -> None:
+    K = game_mode("klondike")
+    cards = [K.C.Card(3, 13, False), K.C.Card(1, 1, True), K.C.Card(0, 7, True)]
+    packed = K._pack_pile(cards)
+    assert isinstance(packed, bytes)
+    restored = K._unpack_pile(packed)
+    assert [(c.suit, c.rank, c.face_up) for c in restored] == [
+        (c.suit, c.rank, c.face_up) for c in cards
+    ]
+    assert K._unpack_pile(K._pack_pile([])) == []
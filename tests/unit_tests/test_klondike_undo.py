@@ -0,0 +1,182 @@
+import pygame
+import pytest
+
+from solitaire import common as C
+
+# Pile ids used by the undo log: 0-3 foundations, 4 stock, 5 waste, 6-12 tableau
+STOCK, WASTE, TABLEAU = 4, 5, 6
+
+
+@pytest.fixture
+def scene(headless_screen, game_mode, monkeypatch, tmp_path):
+    K = game_mode("klondike")
+    monkeypatch.setattr(K, "_klondike_save_path", lambda: str(tmp_path / "klondike_save.json"))
+    # Every click lands a second after the previous one, so none reads as a double-click
+    clock = [0]
+
+    def _ticks():
+        clock[0] += 1000
+        return clock[0]
+
+    monkeypatch.setattr(pygame.time, "get_ticks", _ticks)
+    return K.KlondikeGameScene(None, draw_count=3)
+
+
+def _card(suit, rank, face_up=True):
+    return C.Card(suit, rank, face_up)
+
+
+def _set_board(scene, piles):
+    scene._clear_all_piles()
+    for pid, cards in piles.items():
+        scene._all_piles[pid].cards = list(cards)
+    scene._recount_foundations()
+    scene.undo_log = []
+    scene.compute_layout()
+
+
+def _board(scene):
+    return (
+        [[(c.suit, c.rank, c.face_up) for c in p.cards] for p in scene._all_piles],
+        scene.stock_cycles_used,
+    )
+
+
+def _found_cards(scene):
+    return sum(len(f.cards) for f in scene.foundations)
+
+
+def _card_pos(scene, pid, index):
+    # A point in the visible strip of a fanned card
+    rect = scene._all_piles[pid].rect_for_index(index)
+    return (rect.centerx + scene.scroll_x, rect.y + 4 + scene.scroll_y)
+
+
+def _top_pos(scene, pid):
+    pile = scene._all_piles[pid]
+    rect = pile.top_rect()
+    return (rect.centerx + scene.scroll_x, rect.centery + scene.scroll_y)
+
+
+def _click(scene, pos):
+    scene.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"pos": pos, "button": 1}))
+
+
+def _drag(scene, src_pos, dst_pos):
+    _click(scene, src_pos)
+    assert scene.drag_stack is not None
+    scene.handle_event(pygame.event.Event(pygame.MOUSEBUTTONUP, {"pos": dst_pos, "button": 1}))
+
+
+def test_undo_draw_three_at_end_of_stock(scene) -> None:
+    _set_board(scene, {
+        STOCK: [_card(0, 4, False), _card(1, 9, False)],
+        WASTE: [_card(2, 6), _card(3, 11)],
+    })
+    before = _board(scene)
+    _click(scene, _top_pos(scene, STOCK))
+    assert scene.undo_log[-1] == ("draw", 2)
+    assert not scene.stock_pile.cards and len(scene.waste_pile.cards) == 4
+
+    scene.undo()
+    assert _board(scene) == before
+    assert scene._found_total == _found_cards(scene) == 0
+
+
+def test_undo_waste_recycle(scene) -> None:
+    _set_board(scene, {
+        0: [_card(0, 1)],
+        WASTE: [_card(1, 3), _card(2, 8), _card(3, 12)],
+    })
+    before = _board(scene)
+    _click(scene, _top_pos(scene, STOCK))
+    assert scene.undo_log[-1] == ("recycle",)
+    assert scene.stock_cycles_used == 1 and not scene.waste_pile.cards
+
+    scene.undo()
+    assert _board(scene) == before
+    assert scene._found_total == _found_cards(scene) == 1
+
+
+def test_undo_tableau_move_that_flipped_a_card(scene) -> None:
+    _set_board(scene, {
+        TABLEAU: [_card(3, 10, False), _card(1, 7)],
+        TABLEAU + 1: [_card(0, 8)],
+    })
+    before = _board(scene)
+    _drag(scene, _card_pos(scene, TABLEAU, 1), _top_pos(scene, TABLEAU + 1))
+    assert scene.undo_log[-1] == ("move", TABLEAU, TABLEAU + 1, 1, True)
+    assert scene.tableau[0].cards[-1].face_up
+
+    scene.undo()
+    assert _board(scene) == before
+    assert not scene.tableau[0].cards[0].face_up
+    assert scene._found_total == _found_cards(scene) == 0
+
+
+def test_undone_flip_stays_down_through_an_unrelated_move(scene) -> None:
+    _set_board(scene, {
+        TABLEAU: [_card(0, 5, False)],
+        TABLEAU + 1: [_card(0, 8)],
+        TABLEAU + 2: [_card(1, 9)],
+    })
+    _click(scene, _top_pos(scene, TABLEAU))
+    assert scene.undo_log[-1] == ("flip", TABLEAU)
+    scene.undo()
+    before = _board(scene)
+
+    _drag(scene, _card_pos(scene, TABLEAU + 1, 0), _top_pos(scene, TABLEAU + 2))
+    assert scene.undo_log[-1] == ("move", TABLEAU + 1, TABLEAU + 2, 1, False)
+    assert not scene.tableau[0].cards[0].face_up
+
+    scene.undo()
+    assert _board(scene) == before
+
+
+def test_undo_tableau_to_foundation(scene) -> None:
+    _set_board(scene, {TABLEAU: [_card(0, 5, False), _card(2, 1)]})
+    before = _board(scene)
+    _drag(scene, _card_pos(scene, TABLEAU, 1), _top_pos(scene, 2))
+    assert scene._found_total == _found_cards(scene) == 1
+
+    scene.undo()
+    assert _board(scene) == before
+    assert scene._found_total == _found_cards(scene) == 0
+
+
+def test_undo_foundation_back_to_tableau(scene) -> None:
+    _set_board(scene, {
+        1: [_card(1, r) for r in range(1, 6)],
+        TABLEAU + 2: [_card(0, 6)],
+    })
+    before = _board(scene)
+    _drag(scene, _top_pos(scene, 1), _top_pos(scene, TABLEAU + 2))
+    assert scene.undo_log[-1] == ("move", 1, TABLEAU + 2, 1, False)
+    assert scene._found_total == _found_cards(scene) == 4
+
+    scene.undo()
+    assert _board(scene) == before
+    assert scene._found_total == _found_cards(scene) == 5
+
+
+def test_loaded_auto_finish_moves_one_card_per_step(scene, headless_screen, monkeypatch) -> None:
+    _set_board(scene, {TABLEAU: [_card(0, r) for r in range(13, 0, -1)]})
+    scene.foundation_suits = [0, 1, 2, 3]
+    scene.auto_play_active = True
+    state = scene._state_dict()
+
+    # Load well into the session, as when resuming a saved game
+    now = [600_000]
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: now[0])
+    scene._load_from_state(state)
+    assert scene.auto_play_active
+
+    now[0] += scene.auto_interval_ms
+    scene.draw(headless_screen)
+    assert _found_cards(scene) == 1
+
+    # A long stall owes only a couple of steps, not the rest of the run
+    now[0] += 60 * scene.auto_interval_ms
+    scene.draw(headless_screen)
+    assert _found_cards(scene) <= 3
+    assert scene.auto_play_active
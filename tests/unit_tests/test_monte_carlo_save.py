@@ -0,0 +1,19 @@
+import pytest
+
+
+@pytest.mark.parametrize("suit", range(4))
+@pytest.mark.parametrize("rank", range(1, 14))
+@pytest.mark.parametrize("face_up", [False, True])
+def test_card_data_round_trip(game_mode, suit: int, rank: int, face_up: bool) -> None:
+    MC = game_mode("monte_carlo")
+    data = MC._card_to_data(MC.C.Card(suit, rank, face_up))
+    assert isinstance(data, int)
+    assert MC._decode_card(data) == (suit, rank, face_up)
+
+
+def test_v1_card_dicts_still_load(game_mode) -> None:
+    MC = game_mode("monte_carlo")
+    assert MC._decode_card({"suit": 2, "rank": 12, "face_up": True}) == (2, 12, True)
+    assert MC._is_card_data({"suit": 0, "rank": 1})
+    assert not MC._is_card_data(True)
+    assert not MC._is_card_data("7")
@@ -0,0 +1,73 @@
+import json
+
+import pygame
+
+
+def test_frame_after_last_fill_move_repaints(game_mode, headless_screen, monkeypatch, tmp_path) -> None:
+    MC = game_mode("monte_carlo")
+    monkeypatch.setattr(MC, "_save_path", lambda: str(tmp_path / "monte_carlo_save.json"))
+    now = [1000]
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: now[0])
+
+    scene = MC.MonteCarloGameScene(None)
+    pair = scene._find_adjacent_matching_pair()
+    assert pair is not None
+    scene._remove_pair(*pair)
+    scene.compact_and_fill()
+    assert scene._is_busy()
+
+    # Step the refill until the last card lands inside draw()
+    for _ in range(1000):
+        if not scene._is_busy():
+            break
+        scene.draw(headless_screen)
+        now[0] += 50
+    assert not scene._is_busy()
+    assert scene._gap_count == 0
+
+    # The frame that completed the move painted the card mid-flight; the next
+    # one must paint it settled (and the toolbar's updated enabled states)
+    scene.draw(headless_screen)
+    assert not scene.idle_frame
+
+    scene.draw(headless_screen)
+    assert scene.idle_frame
+
+
+def test_failed_save_is_retried(game_mode, headless_screen, monkeypatch, tmp_path) -> None:
+    MC = game_mode("monte_carlo")
+    save_path = tmp_path / "monte_carlo_save.json"
+    monkeypatch.setattr(MC, "_save_path", lambda: str(save_path))
+
+    scene = MC.MonteCarloGameScene(None)
+    scene._save_game()
+    assert save_path.is_file()
+
+    # Change the board, then fail the swap-in: the older save stays on disk
+    scene._remove_pair(*scene._find_adjacent_matching_pair())
+    # Round-trip through JSON so tuples compare equal to the lists read back
+    state = json.loads(json.dumps(scene._serialise_state()))
+
+    def _fail(src, dst):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(MC.os, "replace", _fail)
+        scene._save_game()
+    assert MC._safe_read_json(str(save_path)) != state
+    assert not (tmp_path / "monte_carlo_save.json.tmp").exists()
+
+    # The same state saved again must not be skipped as already written
+    scene._save_game()
+    assert MC._safe_read_json(str(save_path)) == state
+
+
+def test_clear_saved_game_removes_stranded_temp_file(game_mode, monkeypatch, tmp_path) -> None:
+    MC = game_mode("monte_carlo")
+    save_path = tmp_path / "monte_carlo_save.json"
+    monkeypatch.setattr(MC, "_save_path", lambda: str(save_path))
+    save_path.write_text("{}")
+    (tmp_path / "monte_carlo_save.json.tmp").write_text("{")
+
+    MC._clear_saved_game()
+    assert list(tmp_path.iterdir()) == []